@@ -0,0 +1,116 @@
+"""
+Memory Profile of Character Generation and Output
+
+Generates batches of increasing size under tracemalloc and reports peak
+and retained bytes per character, broken down into the CharacterLore
+objects, their trait lists and relationship dicts, and the narratives
+from to_narrative(). Exits with status 1 if any figure is over its limit,
+so it can run as a regression check.
+
+    python bench_memory.py
+    python bench_memory.py --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from lore_generator import LoreGenerator
+from lore_export import CharacterWriter
+
+# Default limits, in bytes
+LIMITS = {
+    "lore_retained": 1300,
+    "lore_peak": 1500,
+    "narrative_retained": 2000,
+    "stream_peak_total": 1024 * 1024,
+}
+
+def _measure(build):
+    """Run build() Under tracemalloc, Returning (Result, Retained Bytes, Peak Bytes)"""
+    gc.collect()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    current, peak = tracemalloc.get_traced_memory()
+    return result, current - before, peak - before
+
+def breakdown(lores) -> dict:
+    """Average Bytes per Character Owned by Each Part of a CharacterLore
+
+    Corpus strings are shared between characters and not counted.
+    """
+    totals = {"object": 0, "traits": 0, "moments": 0, "relationships": 0}
+    for lore in lores:
+        totals["object"] += sys.getsizeof(lore) + sys.getsizeof(lore.__dict__)
+        totals["traits"] += sys.getsizeof(lore.personality_traits)
+        totals["moments"] += sys.getsizeof(lore.defining_moments)
+        totals["relationships"] += sys.getsizeof(lore.key_relationships) + sum(
+            sys.getsizeof(rel) for rel in lore.key_relationships
+        )
+    return {part: total / len(lores) for part, total in totals.items()}
+
+def profile(generator: LoreGenerator, size: int) -> dict:
+    """Memory Figures for One Batch Size"""
+    lores, lore_retained, lore_peak = _measure(
+        lambda: [generator.generate_at(0, index) for index in range(size)]
+    )
+    narratives, narrative_retained, _ = _measure(
+        lambda: [lore.to_narrative() for lore in lores]
+    )
+    parts = breakdown(lores[:1000])
+    del narratives, lores
+
+    with tempfile.TemporaryDirectory() as directory:
+        def stream():
+            with CharacterWriter(os.path.join(directory, "characters.md"), size) as writer:
+                for index in range(size):
+                    writer.write(generator.generate_at(0, index))
+        _, _, stream_peak = _measure(stream)
+
+    return {
+        "size": size,
+        "lore_retained": lore_retained / size,
+        "lore_peak": lore_peak / size,
+        "narrative_retained": narrative_retained / size,
+        "stream_peak_total": stream_peak,
+        "parts": parts,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type = int, nargs = "+", default = [1000, 10000, 100000])
+    for name, default in LIMITS.items():
+        parser.add_argument("--max-" + name.replace("_", "-"), type = int, default = default,
+                            dest = name, help = f"limit in bytes (default {default})")
+    args = parser.parse_args()
+
+    generator = LoreGenerator()
+    tracemalloc.start()
+
+    failures = []
+    print(f"{'Characters':>10} {'Lore':>8} {'Peak':>8} {'Narrative':>10} {'Stream peak':>12}"
+          f"   per character: object / traits / moments / relationships")
+    for size in args.sizes:
+        result = profile(generator, size)
+        parts = result["parts"]
+        print(f"{size:>10} {result['lore_retained']:>8.0f} {result['lore_peak']:>8.0f} "
+              f"{result['narrative_retained']:>10.0f} {result['stream_peak_total'] / 1024:>10.0f}KB"
+              f"   {parts['object']:.0f} / {parts['traits']:.0f} / {parts['moments']:.0f} / {parts['relationships']:.0f}")
+        for name in LIMITS:
+            if result[name] > getattr(args, name):
+                failures.append(f"{name} at {size} characters: {result[name]:.0f} > {getattr(args, name)}")
+
+    tracemalloc.stop()
+    if failures:
+        print("\nOver limit:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nAll figures within limits.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark Shared-Memory Handoff Against a Plain Pool Map
+
+Writes the same seeded roster to all_characters.md-style exports two
+ways: workers returning lists of CharacterLore from Pool.map, which are
+pickled back to the parent and rendered there, and workers writing
+rendered narratives into a SharedRing that the parent flushes from in
+place. Checks both files are identical.
+
+    python bench_shm.py
+    python bench_shm.py --total 200000 --processes 8
+"""
+
+import argparse
+import filecmp
+import multiprocessing
+import os
+import tempfile
+import time
+
+from lore_generator import LoreGenerator
+from lore_export import CharacterWriter
+from lore_shm import SharedRing
+
+_generator = None
+
+def _init_worker(generator: LoreGenerator) -> None:
+    global _generator
+    _generator = generator
+
+def _generate_chunk(task):
+    seed, start, stop = task
+    return [_generator.generate_at(seed, index) for index in range(start, stop)]
+
+def pool_map(path: str, total: int, seed: int, generator: LoreGenerator,
+             processes: int, batch_size: int) -> None:
+    """Baseline: Pool.map Over Chunks, Writing the Pickled Results"""
+    tasks = [(seed, start, min(start + batch_size, total)) for start in range(0, total, batch_size)]
+    with multiprocessing.Pool(processes, initializer = _init_worker, initargs = (generator,)) as pool:
+        with CharacterWriter(path, total) as writer:
+            for chunk in pool.imap(_generate_chunk, tasks):
+                for lore in chunk:
+                    writer.write(lore)
+
+def shared_ring(path: str, total: int, seed: int, generator: LoreGenerator,
+                processes: int, batch_size: int) -> None:
+    """Shared-Memory Ring, Rendering Straight from the Slots"""
+    SharedRing(generator, processes, batch_size).write(path, total, seed)
+
+def _time(run, *args) -> float:
+    start = time.perf_counter()
+    run(*args)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument("--total", type = int, default = 50000)
+    parser.add_argument("--processes", type = int, default = min(4, multiprocessing.cpu_count()))
+    parser.add_argument("--batch-size", type = int, default = 256)
+    parser.add_argument("--seed", type = int, default = 0)
+    args = parser.parse_args()
+
+    generator = LoreGenerator()
+    print(f"{args.total} characters, {args.processes} workers, batches of {args.batch_size}\n")
+    with tempfile.TemporaryDirectory() as directory:
+        baseline_path = os.path.join(directory, "pool_map.md")
+        ring_path = os.path.join(directory, "shared_ring.md")
+        run_args = (args.total, args.seed, generator, args.processes, args.batch_size)
+
+        baseline = _time(pool_map, baseline_path, *run_args)
+        ring = _time(shared_ring, ring_path, *run_args)
+
+        print(f"{'Pool map':<12} {baseline:8.2f}s {args.total / baseline:10.0f} characters/s")
+        print(f"{'Shared ring':<12} {ring:8.2f}s {args.total / ring:10.0f} characters/s")
+        print(f"\nSpeedup: {baseline / ring:.2f}x")
+        print("Outputs identical:", filecmp.cmp(baseline_path, ring_path, shallow = False))
+
+if __name__ == "__main__":
+    main()
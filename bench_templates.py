@@ -0,0 +1,36 @@
+"""
+Compiled Template Rendering Benchmark
+"""
+
+import sys
+import time
+
+from lore_generator import LoreGenerator, LoreParameters
+from lore_templates import TemplateEngine
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    generator = LoreGenerator(LoreParameters(mystery_factor = 0.5), seed = 0)
+    engine = TemplateEngine(generator)
+    characters = [generator.generate() for _ in range(count)]
+
+    for lore in characters[:1000]:
+        assert engine.render(lore) == lore.to_narrative()
+
+    start = time.perf_counter()
+    for lore in characters:
+        lore.to_narrative()
+    narrative = time.perf_counter() - start
+
+    start = time.perf_counter()
+    render = engine.render
+    for lore in characters:
+        render(lore)
+    compiled = time.perf_counter() - start
+
+    print(f"=== Rendering {count} Characters ===\n")
+    print(f"to_narrative():     {narrative:.3f}s ({count / narrative:.0f}/s)")
+    print(f"Compiled template:  {compiled:.3f}s ({count / compiled:.0f}/s)")
+
+if __name__ == "__main__":
+    main()
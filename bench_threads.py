@@ -0,0 +1,39 @@
+"""
+Threaded Generation Throughput Benchmark
+"""
+
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from lore_generator import LoreGenerator
+
+def run(generator: LoreGenerator, threads: int, total: int, shared: bool) -> float:
+    """Generate total Characters Split Across Threads, Returning Characters per Second"""
+    per_thread = total // threads
+    rng = random if shared else None
+
+    def work(_):
+        for _ in range(per_thread):
+            generator.generate(rng = rng)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(work, range(threads)))
+    return per_thread * threads / (time.perf_counter() - start)
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 40000
+    generator = LoreGenerator(seed = 0)
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+    print(f"=== Threaded Generation ({total} characters, GIL {'on' if gil else 'off'}) ===\n")
+    print(f"{'Threads':>7} {'Shared random':>15} {'Per-thread rng':>15}")
+    for threads in (1, 2, 4, 8):
+        shared = run(generator, threads, total, shared = True)
+        owned = run(generator, threads, total, shared = False)
+        print(f"{threads:>7} {shared:>13.0f}/s {owned:>13.0f}/s")
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ Generate Multiple Character Lores
 """
 
 from lore_generator import LoreGenerator, LoreParameters, Archetype, Origin
+from lore_export import CharacterWriter, compression_suffix
 
 """Adjust Parameters Here"""
 
@@ -21,23 +22,23 @@ num_characters = 20
 
 print(f"=== Generating {num_characters} Random Characters ===\n")
 
-all_narratives = []
-
-for i in range(num_characters):
-    print(f"\nGenerating Character {i+1}...")
-    
-    lore = generator.generate()
-    narrative = lore.to_narrative()
-    all_narratives.append(narrative)
-
-output_file = "all_characters.md"
-with open(output_file, "w") as f:
-    f.write(f"# Generated Characters ({num_characters} Total)\n\n")
-    f.write("---\n\n")
-    for i, narrative in enumerate(all_narratives, 1):
-        f.write(f"## Character {i}\n\n")
-        f.write(narrative)
-        f.write("\n\n---\n\n")
+"""Adjust Output Compression Here ("gzip", "bz2", "xz", "zstd" or None)"""
+
+compression = None
+compression_level = None
+
+"""Write a Sidecar Index for Random Access (Uncompressed Output Only)"""
+
+write_index = False
+
+output_file = "all_characters.md" + compression_suffix(compression)
+
+with CharacterWriter(output_file, num_characters, compression, compression_level, write_index) as writer:
+    for i in range(num_characters):
+        print(f"\nGenerating Character {i+1}...")
+
+        lore = generator.generate()
+        writer.write(lore)
 
 print(f"\nDone! Generated {num_characters} characters.")
 print(f"All characters saved to {output_file}.")
\ No newline at end of file
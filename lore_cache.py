@@ -0,0 +1,110 @@
+"""
+Size-Bounded Cache of Seeded Characters
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from lore_generator import LoreGenerator, LoreParameters, CharacterLore
+
+# Generators derived for other params, kept for reuse
+MAX_DERIVED_GENERATORS = 32
+
+class LoreCache:
+    """LRU Cache Mapping (Corpus, Params, Seed, Index) to a Character and Its Narrative
+
+    Seeded characters are deterministic, so repeated requests for the same
+    NPC are served from memory instead of re-running generate() and
+    to_narrative(). Keys include the corpus name and version, so after
+    reload_corpus() old entries are never returned and simply age out.
+    The least recently used entry is evicted once the cache holds maxsize
+    characters.
+    """
+
+    def __init__(self, generator: Optional[LoreGenerator] = None, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.generator = generator or LoreGenerator()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._derived = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, generator: LoreGenerator, params: tuple, seed: int, index: int) -> tuple:
+        return (generator.corpus_name, generator.corpus_version, params, seed, index)
+
+    def _generator_for(self, generator: LoreGenerator, params: LoreParameters, values: tuple) -> LoreGenerator:
+        """Generator Drawing with params, Reusing Recently Derived Ones (Call Under the Lock)"""
+        if params == generator.params:
+            return generator
+        key = (id(generator), values)
+        derived = self._derived.get(key)
+        if derived is not None and derived[0] is generator:
+            self._derived.move_to_end(key)
+            return derived[1]
+        # The base generator is kept alongside so its id stays unique
+        self._derived[key] = (generator, generator.with_params(params))
+        while len(self._derived) > MAX_DERIVED_GENERATORS:
+            self._derived.popitem(last = False)
+        return self._derived[key][1]
+
+    def _entry(self, seed: int, index: int, params: Optional[LoreParameters],
+               generator: Optional[LoreGenerator]) -> list:
+        """Look Up or Generate the [lore, narrative] Entry for a Key"""
+        generator = generator or self.generator
+        params = params or generator.params
+        values = tuple(vars(params).values())
+        key = self._key(generator, values, seed, index)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            generator = self._generator_for(generator, params, values)
+
+        entry = [generator.generate_at(seed, index), None]
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last = False)
+        return entry
+
+    def get(self, seed: int, index: int,
+            params: Optional[LoreParameters] = None,
+            generator: Optional[LoreGenerator] = None) -> CharacterLore:
+        """Character at a Seeded Position
+
+        Args:
+            seed: Roster Seed
+            index: Position in the Roster
+            params: Generation Parameters (the generator's if None)
+            generator: Generator Supplying the Corpus (the cache's if None)
+        """
+        return self._entry(seed, index, params, generator)[0]
+
+    def narrative(self, seed: int, index: int,
+                  params: Optional[LoreParameters] = None,
+                  generator: Optional[LoreGenerator] = None) -> str:
+        """Rendered Narrative of the Character at a Seeded Position"""
+        entry = self._entry(seed, index, params, generator)
+        if entry[1] is None:
+            entry[1] = entry[0].to_narrative()
+        return entry[1]
+
+    def clear(self) -> None:
+        """Drop All Cached Characters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
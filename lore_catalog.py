@@ -0,0 +1,85 @@
+"""
+Paginated Browsing over a Seeded Character Catalog
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from lore_generator import LoreGenerator, LoreParameters, CharacterLore, Archetype, Origin
+from lore_cache import LoreCache
+
+DEFAULT_PAGE_SIZE = 50
+
+@dataclass
+class CatalogRow:
+    """Summary of One Catalog Entry"""
+    index: int
+    name: str
+    archetype: Archetype
+    origin: Origin
+
+class Catalog:
+    """An Unbounded, Seeded Roster Browsed One Page at a Time
+
+    Every entry is generated from its own position, so any page costs the
+    same to compute however deep it is, and earlier pages are never built.
+    """
+
+    def __init__(self, seed: int, params: Optional[LoreParameters] = None,
+                 generator: Optional[LoreGenerator] = None,
+                 cache: Optional[LoreCache] = None):
+        """Open a Catalog
+
+        Args:
+            seed: Roster Seed
+            params: Generation Parameters (the generator's if None)
+            generator: Generator Supplying the Corpus (a new one if None)
+            cache: Cache Serving Repeated Full Pages (none if None); entries
+                are generated and keyed with this catalog's generator, so one
+                cache can serve catalogs on different corpora
+        """
+        generator = generator or LoreGenerator()
+        if params is not None:
+            generator = generator.with_params(params)
+        self.seed = seed
+        self.generator = generator
+        self.cache = cache
+
+    @staticmethod
+    def _range(k: int, size: int) -> range:
+        if k < 0:
+            raise ValueError("Page numbers start at 0")
+        if size < 1:
+            raise ValueError("Page size must be at least 1")
+        return range(k * size, (k + 1) * size)
+
+    def page(self, k: int, size: int = DEFAULT_PAGE_SIZE) -> List[CharacterLore]:
+        """Full Characters on Page k (0-based)"""
+        if self.cache is not None:
+            generator = self.generator
+            return [self.cache.get(self.seed, index, generator = generator) for index in self._range(k, size)]
+        return [self.generator.generate_at(self.seed, index) for index in self._range(k, size)]
+
+    def summary_page(self, k: int, size: int = DEFAULT_PAGE_SIZE) -> List[CatalogRow]:
+        """Name, Archetype and Origin of Each Entry on Page k
+
+        Only the first draws of each entry are made; no CharacterLore or
+        narrative is built.
+        """
+        rows = []
+        for index in self._range(k, size):
+            archetype, origin, name = self.generator.identity_at(self.seed, index)
+            rows.append(CatalogRow(index, name, archetype, origin))
+        return rows
+
+    def get(self, index: int) -> CharacterLore:
+        """Full Character at One Catalog Position"""
+        if self.cache is not None:
+            return self.cache.get(self.seed, index, generator = self.generator)
+        return self.generator.generate_at(self.seed, index)
+
+def catalog(seed: int, params: Optional[LoreParameters] = None,
+            generator: Optional[LoreGenerator] = None,
+            cache: Optional[LoreCache] = None) -> Catalog:
+    """Open a Seeded Catalog, e.g. catalog(42).page(3, 50)"""
+    return Catalog(seed, params, generator, cache)
@@ -0,0 +1,317 @@
+"""
+Compact Fixed-Width Encoding of Character Lore
+"""
+
+import hashlib
+import mmap
+import struct
+from typing import Iterator, Optional
+
+from lore_generator import LoreGenerator, CharacterLore, ARCHETYPES, ORIGINS
+
+FORMAT_VERSION = 1
+
+MAX_TRAITS = 4
+MAX_MOMENTS = 5
+MAX_RELATIONSHIPS = 6
+
+# Marks an empty slot in a one byte field
+NONE_INDEX = 0xFF
+# Marks a name that is not in the corpus
+CUSTOM_NAME = 0xFFFF
+
+# archetype, origin, age, name
+# positive, negative, neutral and extra trait
+# feature, birthplace, motivation, flaw, fear, conflict, hidden truth
+# defining moments
+# (role, description, name origin, name) per relationship
+RECORD = struct.Struct(
+    "<BBBH"
+    + "B" * MAX_TRAITS
+    + "BBBBBBB"
+    + "B" * MAX_MOMENTS
+    + "BBBH" * MAX_RELATIONSHIPS
+)
+RECORD_SIZE = RECORD.size
+
+# magic, format version, record size, corpus version, record count
+FILE_HEADER = struct.Struct("<4sHH16sQ")
+FILE_MAGIC = b"LORE"
+
+def _index(values) -> dict:
+    """Map Each Value to the Position of Its First Occurrence"""
+    positions = {}
+    for i, value in enumerate(values):
+        positions.setdefault(value, i)
+    return positions
+
+class LoreCodec:
+    """Packs CharacterLore into Fixed-Width Records Against One Corpus
+
+    Every field is stored as its index in the generator's corpus tables, so a
+    record is only meaningful for the corpus version it was encoded with.
+    """
+
+    def __init__(self, generator: LoreGenerator):
+        self.generator = generator
+        self.corpus = generator.corpus
+        self.corpus_version = self.corpus.version
+
+        g = self.corpus
+        self.extra_traits = g.extra_traits
+        self.moments = g.tragedy_moments + g.triumph_moments + g.revelation_moments
+        self._check_tables()
+
+        self._archetypes = {a: i for i, a in enumerate(ARCHETYPES)}
+        self._origins = {o: i for i, o in enumerate(ORIGINS)}
+        self._names = {origin: _index(names) for origin, names in g.names.items()}
+        self._any_names = {}
+        for origin in reversed(ORIGINS):
+            for name, i in self._names[origin].items():
+                self._any_names[name] = (self._origins[origin], i)
+        self._positive = _index(g.personality_positive)
+        self._negative = _index(g.personality_negative)
+        self._neutral = _index(g.personality_neutral)
+        self._extra = _index(self.extra_traits)
+        self._features = _index(g.distinctive_features)
+        self._birthplaces = _index(g.birthplaces)
+        self._motivations = {a: _index(m) for a, m in g.motivations.items()}
+        self._flaws = _index(g.fatal_flaws)
+        self._fears = _index(g.greatest_fears)
+        self._conflicts = _index(g.internal_conflicts)
+        self._truths = _index(g.hidden_truths)
+        self._moments = _index(self.moments)
+        self._roles = {rel["role"]: i for i, rel in enumerate(g.relationships)}
+        self._descriptions = [_index(rel["descriptions"]) for rel in g.relationships]
+
+    def _check_tables(self) -> None:
+        """Make Sure Every Corpus Index Fits Its Record Field Below the Sentinels"""
+        g = self.corpus
+        one_byte = {
+            "personality_positive": g.personality_positive,
+            "personality_negative": g.personality_negative,
+            "personality_neutral": g.personality_neutral,
+            "personality_positive + personality_neutral": self.extra_traits,
+            "distinctive_features": g.distinctive_features,
+            "birthplaces": g.birthplaces,
+            "fatal_flaws": g.fatal_flaws,
+            "greatest_fears": g.greatest_fears,
+            "internal_conflicts": g.internal_conflicts,
+            "hidden_truths": g.hidden_truths,
+            "tragedy_moments + triumph_moments + revelation_moments": self.moments,
+            "relationships": g.relationships,
+        }
+        for archetype, motivations in g.motivations.items():
+            one_byte[f"motivations[{archetype.value}]"] = motivations
+        for rel in g.relationships:
+            one_byte[f"relationships[{rel['role']}] descriptions"] = rel["descriptions"]
+
+        too_long = [f"{section} ({len(table)} > {NONE_INDEX})"
+                    for section, table in one_byte.items() if len(table) > NONE_INDEX]
+        too_long += [f"names[{origin.value}] ({len(names)} > {CUSTOM_NAME})"
+                     for origin, names in g.names.items() if len(names) > CUSTOM_NAME]
+        if too_long:
+            raise ValueError(f"Corpus {g.name!r} has sections too large to encode: {', '.join(too_long)}")
+
+    def encode(self, lore: CharacterLore) -> bytes:
+        """Encode One Character as a Record"""
+        buffer = bytearray(RECORD_SIZE)
+        self.encode_into(buffer, 0, lore)
+        return bytes(buffer)
+
+    def encode_into(self, buffer, offset: int, lore: CharacterLore) -> None:
+        """Encode One Character Directly into a Writable Buffer"""
+        RECORD.pack_into(buffer, offset, *self._fields(lore))
+
+    def _fields(self, lore: CharacterLore) -> list:
+        """Flatten a Character into Record Field Values"""
+        try:
+            if not 0 <= lore.age <= 0xFF:
+                raise ValueError(f"Age out of range: {lore.age}")
+            if len(lore.personality_traits) < MAX_TRAITS - 1:
+                raise ValueError("Expected at least three personality traits")
+            if len(lore.personality_traits) > MAX_TRAITS:
+                raise ValueError(f"More than {MAX_TRAITS} personality traits")
+            if len(lore.defining_moments) > MAX_MOMENTS:
+                raise ValueError(f"More than {MAX_MOMENTS} defining moments")
+            if len(lore.key_relationships) > MAX_RELATIONSHIPS:
+                raise ValueError(f"More than {MAX_RELATIONSHIPS} relationships")
+
+            traits = lore.personality_traits
+            fields = [
+                self._archetypes[lore.archetype],
+                self._origins[lore.origin],
+                lore.age,
+                self._names[lore.origin].get(lore.name, CUSTOM_NAME),
+                self._positive[traits[0]],
+                self._negative[traits[1]],
+                self._neutral[traits[2]],
+                self._extra[traits[3]] if len(traits) > 3 else NONE_INDEX,
+                self._features[lore.distinctive_features],
+                self._birthplaces[lore.birthplace],
+                self._motivations[lore.archetype][lore.core_motivation],
+                self._flaws[lore.fatal_flaw],
+                self._fears[lore.greatest_fear],
+                self._conflicts[lore.internal_conflict],
+                self._truths[lore.hidden_truth] if lore.hidden_truth else NONE_INDEX,
+            ]
+
+            moments = [self._moments[moment] for moment in lore.defining_moments]
+            fields.extend(moments + [NONE_INDEX] * (MAX_MOMENTS - len(moments)))
+
+            for rel in lore.key_relationships:
+                role = self._roles[rel["role"]]
+                name_origin, name = self._any_names[rel["name"]]
+                fields.extend((role, self._descriptions[role][rel["description"]], name_origin, name))
+            fields.extend((NONE_INDEX, NONE_INDEX, NONE_INDEX, 0) * (MAX_RELATIONSHIPS - len(lore.key_relationships)))
+        except KeyError as e:
+            raise ValueError(f"Value not in corpus {self.corpus_version}: {e}") from None
+        return fields
+
+    def character_id(self, lore: CharacterLore) -> str:
+        """Stable Content Hash of a Character's Choices and Corpus Version"""
+        digest = hashlib.blake2b(digest_size = 16)
+        digest.update(self.corpus_version.encode("ascii"))
+        digest.update(self.encode(lore))
+        if lore.name not in self._names[lore.origin]:
+            digest.update(lore.name.encode("utf-8"))
+        return digest.hexdigest()
+
+    def decode(self, buffer, offset: int = 0, name: Optional[str] = None) -> CharacterLore:
+        """Decode One Record Without Copying It Out of the Buffer
+
+        Args:
+            buffer: Any Buffer Holding Records (bytes, mmap, shared memory)
+            offset: Byte Offset of the Record
+            name: Name to Use When the Record Holds a Custom Name
+
+        Returns:
+            Character Lore
+        """
+        g = self.corpus
+        fields = RECORD.unpack_from(buffer, offset)
+
+        archetype = ARCHETYPES[fields[0]]
+        origin = ORIGINS[fields[1]]
+        if fields[3] != CUSTOM_NAME:
+            name = g.names[origin][fields[3]]
+        elif name is None:
+            raise ValueError("Record holds a custom name, pass it as name")
+
+        traits = [
+            g.personality_positive[fields[4]],
+            g.personality_negative[fields[5]],
+            g.personality_neutral[fields[6]],
+        ]
+        if fields[7] != NONE_INDEX:
+            traits.append(self.extra_traits[fields[7]])
+
+        position = 4 + MAX_TRAITS + 7
+        moments = [self.moments[i] for i in fields[position:position + MAX_MOMENTS] if i != NONE_INDEX]
+        position += MAX_MOMENTS
+
+        relationships = []
+        for _ in range(MAX_RELATIONSHIPS):
+            role, description, name_origin, rel_name = fields[position:position + 4]
+            position += 4
+            if role == NONE_INDEX:
+                break
+            rel = g.relationships[role]
+            relationships.append({
+                "name": g.names[ORIGINS[name_origin]][rel_name],
+                "role": rel["role"],
+                "description": rel["descriptions"][description]
+            })
+
+        lore = CharacterLore(
+            name = name,
+            age = fields[2],
+            archetype = archetype,
+            personality_traits = traits,
+            distinctive_features = g.distinctive_features[fields[8]],
+            origin = origin,
+            birthplace = g.birthplaces[fields[9]],
+            defining_moments = moments,
+            core_motivation = g.motivations[archetype][fields[10]],
+            fatal_flaw = g.fatal_flaws[fields[11]],
+            greatest_fear = g.greatest_fears[fields[12]],
+            internal_conflict = g.internal_conflicts[fields[13]],
+            hidden_truth = g.hidden_truths[fields[14]] if fields[14] != NONE_INDEX else None,
+            key_relationships = relationships
+        )
+        lore._has_placeholders = g.placeholders
+        return lore
+
+class CharacterArrayWriter:
+    """Writes Encoded Characters to a Flat Array File"""
+
+    def __init__(self, path: str, codec: LoreCodec):
+        self.codec = codec
+        self.count = 0
+        self._buffer = bytearray(RECORD_SIZE)
+        self._file = open(path, "wb")
+        self._file.write(self._header())
+
+    def _header(self) -> bytes:
+        return FILE_HEADER.pack(FILE_MAGIC, FORMAT_VERSION, RECORD_SIZE,
+                                self.codec.corpus_version.encode("ascii"), self.count)
+
+    def write(self, lore: CharacterLore) -> None:
+        """Append One Character (Custom Names Cannot Be Stored)"""
+        self.codec.encode_into(self._buffer, 0, lore)
+        if RECORD.unpack_from(self._buffer, 0)[3] == CUSTOM_NAME:
+            raise ValueError(f"Custom name {lore.name!r} cannot be stored in an array file")
+        self._file.write(self._buffer)
+        self.count += 1
+
+    def close(self) -> None:
+        """Record the Final Count and Close the File"""
+        self._file.seek(0)
+        self._file.write(self._header())
+        self._file.close()
+
+    def __enter__(self) -> 'CharacterArrayWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+class CharacterArray:
+    """Memory-Mapped Array File Decoded Row by Row on Demand"""
+
+    def __init__(self, path: str, codec: LoreCodec):
+        self.codec = codec
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+
+        magic, version, record_size, corpus_version, count = FILE_HEADER.unpack_from(self._map, 0)
+        if magic != FILE_MAGIC or version != FORMAT_VERSION or record_size != RECORD_SIZE:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} character array")
+        corpus_version = corpus_version.decode("ascii")
+        if corpus_version != codec.corpus_version:
+            raise ValueError(f"{path} was encoded with corpus {corpus_version}, "
+                             f"not {codec.corpus_version}")
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> CharacterLore:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("character index out of range")
+        return self.codec.decode(self._map, FILE_HEADER.size + index * RECORD_SIZE)
+
+    def __iter__(self) -> Iterator[CharacterLore]:
+        for i in range(self.count):
+            yield self[i]
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> 'CharacterArray':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,164 @@
+"""
+Trait Coherence Scoring and Batch Filtering
+"""
+
+import heapq
+from array import array
+from itertools import combinations, repeat
+from operator import add, mul, truediv
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from lore_generator import LoreGenerator, CharacterLore, Corpus
+
+# Themes and the word prefixes or phrases that mark an entry as having them
+THEMES = {
+    "bold": ["assertive", "decisive", "adventurous", "spirited", "pioneering", "confident",
+             "spontaneous", "impulsive", "reckless", "aggressive", "defiant",
+             "quick temper", "unnecessary risks"],
+    "cautious": ["cautious", "reserved", "quiet", "reflective", "methodical", "patient",
+                 "cowardly", "overthink", "second-guess", "fear of failure"],
+    "trusting": ["trustworthy", "loyal", "sincere", "honest", "forgiving", "friendly",
+                 "cooperative", "supportive", "trust the wrong", "forgive too easily"],
+    "distrustful": ["distrustful", "deceitful", "manipulative", "disloyal", "hypocritical",
+                    "fear of intimacy", "fear of abandonment", "taken advantage"],
+    "proud": ["arrogant", "boastful", "conceited", "egotistical", "narcissistic", "stubborn",
+              "inflexible", "judgmental", "pride", "refusal to change"],
+    "humble": ["humble", "gracious", "insecurity", "inadequacy"],
+    "controlling": ["domineering", "perfectionist", "need for control", "micromanaging"],
+    "flexible": ["flexible", "spontaneous", "pragmatic", "practical"],
+    "kind": ["caring", "generous", "gracious", "forgiving", "supportive", "patient",
+             "help others", "compassion"],
+    "cruel": ["cruel", "malicious", "ruthless", "spiteful", "vengeful", "vindictive",
+              "inconsiderate", "greedy", "revenge"],
+    "social": ["sociable", "charismatic", "friendly", "eloquent", "humorous"],
+    "solitary": ["reserved", "quiet", "independent", "independence", "loneliness", "isolation",
+                 "push others away"],
+    "optimistic": ["optimistic", "passionate", "spirited", "visionary"],
+    "pessimistic": ["pessimistic", "apathetic", "believing the worst", "negative perspective"],
+}
+
+# Themes that contradict each other
+OPPOSED_THEMES = [
+    ("bold", "cautious"),
+    ("trusting", "distrustful"),
+    ("proud", "humble"),
+    ("controlling", "flexible"),
+    ("kind", "cruel"),
+    ("social", "solitary"),
+    ("optimistic", "pessimistic"),
+]
+
+# Trait slots, then the fatal flaw and internal conflict
+SLOTS = 6
+# Number of slot pairs, by number of empty slots
+_PAIRS = [(SLOTS - empty) * (SLOTS - empty - 1) // 2 for empty in range(SLOTS - 1)]
+# Largest reward or penalty a single pair can contribute
+MAX_PAIR_SCORE = 2
+
+def entry_themes(text: str) -> set:
+    """Themes Whose Markers Appear in a Corpus Entry"""
+    lowered = text.lower()
+    words = lowered.replace(",", " ").split()
+    themes = set()
+    for theme, markers in THEMES.items():
+        for marker in markers:
+            if " " in marker:
+                found = marker in lowered
+            else:
+                found = any(word.startswith(marker) for word in words)
+            if found:
+                themes.add(theme)
+                break
+    return themes
+
+class CoherenceModel:
+    """Pairwise Compatibility Matrix over Traits, Fatal Flaws and Internal Conflicts
+
+    Entries sharing a theme reinforce each other and entries with opposed
+    themes (bold and cautious, trusting and distrustful, ...) clash. The
+    matrix is built once per corpus; scoring a batch reads it with index
+    arithmetic over whole columns of candidates at a time.
+    """
+
+    def __init__(self, corpus: Corpus):
+        self.corpus = corpus
+        self.entries: List[str] = []
+        self._positions: Dict[str, int] = {}
+        for text in (corpus.personality_positive + corpus.personality_negative
+                     + corpus.personality_neutral + corpus.fatal_flaws + corpus.internal_conflicts):
+            if text not in self._positions:
+                self._positions[text] = len(self.entries)
+                self.entries.append(text)
+
+        # Last entry stands for an empty slot and scores 0 with everything
+        self.empty = len(self.entries)
+        self.size = self.empty + 1
+
+        themes = [entry_themes(text) for text in self.entries] + [set()]
+        self.matrix = array("b", bytes(self.size * self.size))
+        for i in range(self.empty):
+            for j in range(i + 1, self.empty):
+                score = len(themes[i] & themes[j])
+                for a, b in OPPOSED_THEMES:
+                    if (a in themes[i] and b in themes[j]) or (b in themes[i] and a in themes[j]):
+                        score -= 1
+                score = max(-MAX_PAIR_SCORE, min(MAX_PAIR_SCORE, score))
+                self.matrix[i * self.size + j] = score
+                self.matrix[j * self.size + i] = score
+            # The same trait twice is redundant
+            self.matrix[i * self.size + i] = -1
+
+    def encode(self, lore: CharacterLore) -> Tuple[int, ...]:
+        """Matrix Positions of a Character's Traits, Flaw and Conflict"""
+        positions = self._positions
+        row = [positions[trait] for trait in lore.personality_traits[:SLOTS - 2]]
+        row += [self.empty] * (SLOTS - 2 - len(row))
+        row.append(positions[lore.fatal_flaw])
+        row.append(positions[lore.internal_conflict])
+        return tuple(row)
+
+    def score(self, lore: CharacterLore) -> float:
+        """Mean Pairwise Compatibility of One Character"""
+        return self.score_batch([self.encode(lore)])[0]
+
+    def score_batch(self, rows: Sequence[Tuple[int, ...]]) -> List[float]:
+        """Mean Pairwise Compatibility of Many Encoded Characters
+
+        Works column by column: each slot pair is one pass over all
+        candidates, looking the pair scores up by flat index.
+        """
+        columns = list(zip(*rows))
+        if not columns:
+            return []
+        size = self.size
+        lookup = self.matrix.__getitem__
+
+        totals = [0] * len(rows)
+        for p, q in combinations(range(SLOTS), 2):
+            flat = map(add, map(mul, columns[p], repeat(size)), columns[q])
+            totals = list(map(add, totals, map(lookup, flat)))
+
+        # Pairs among the filled slots of each character
+        empty = [0] * len(rows)
+        for column in columns:
+            empty = list(map(add, empty, map(self.empty.__eq__, column)))
+        pairs = map(_PAIRS.__getitem__, empty)
+        return list(map(truediv, totals, pairs))
+
+    def top(self, lores: Sequence[CharacterLore], count: int) -> List[CharacterLore]:
+        """The count Most Coherent Characters, Kept in Their Original Order"""
+        scores = self.score_batch([self.encode(lore) for lore in lores])
+        best = heapq.nlargest(count, range(len(lores)), key = scores.__getitem__)
+        return [lores[i] for i in sorted(best)]
+
+    def filter(self, lores: Sequence[CharacterLore], min_score: float) -> List[CharacterLore]:
+        """Characters Scoring at Least min_score"""
+        scores = self.score_batch([self.encode(lore) for lore in lores])
+        return [lore for lore, score in zip(lores, scores) if score >= min_score]
+
+def generate_coherent(generator: LoreGenerator, count: int, oversample: int = 4,
+                      model: Optional[CoherenceModel] = None) -> List[CharacterLore]:
+    """Generate count Characters, Keeping the Most Coherent of count * oversample Candidates"""
+    model = model or CoherenceModel(generator.corpus)
+    candidates = [generator.generate() for _ in range(count * oversample)]
+    return model.top(candidates, count)
@@ -0,0 +1,307 @@
+"""
+Evolving a Population of Characters Over In-Game Years
+"""
+
+import math
+import random
+import time
+from array import array
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from lore_generator import (
+    LoreParameters, CharacterLore, AGE_RANGES, ARCHETYPES, DEFAULT_CORPUS, get_corpus
+)
+
+# Yearly chance of a new defining moment, split by tragedy_weight into tragedies and triumphs
+MOMENT_RATE = 0.02
+# Yearly chance a hidden truth comes out, scaled by 1 - mystery_factor
+REVEAL_RATE = 0.05
+# Yearly chance of gaining a hidden truth, scaled by mystery_factor
+SECRET_RATE = 0.01
+# Yearly chance of a relationship changing, scaled by relationship_weight / 5
+RELATIONSHIP_RATE = 0.03
+
+# Marks a character without a hidden truth
+NO_TRUTH = 0xFF
+
+# Relationship status after a change for the worse, and for the better
+WORSENS = {None: "estranged", "reconciled": "estranged", "estranged": "lost"}
+IMPROVES = {"estranged": "reconciled"}
+
+@dataclass
+class CharacterDelta:
+    """What Changed for One Character in One Tick"""
+    index: int
+    tick: int
+    age: int
+    new_moments: List[str] = field(default_factory = list)
+    relationship_changes: List[Tuple[int, str]] = field(default_factory = list) # (slot, status)
+    revealed_truth: Optional[str] = None
+    new_hidden_truth: Optional[str] = None
+
+def _event_positions(rng: random.Random, count: int, p: float) -> List[int]:
+    """Positions Among count Where an Event of Chance p Happens
+
+    Jumps from one event to the next by geometrically distributed gaps,
+    so the cost follows the number of events rather than count.
+    """
+    if p <= 0:
+        return []
+    if p >= 1:
+        return list(range(count))
+    log_q = math.log(1 - p)
+    positions = []
+    position = -1
+    while True:
+        position += int(math.log(1 - rng.random()) / log_q) + 1
+        if position >= count:
+            return positions
+        positions.append(position)
+
+class Population:
+    """A Whole World's Characters Held as Flat Arrays and Stepped a Year at a Time
+
+    Ages are stored once as the age at tick 0, so aging everyone is a
+    single counter. New moments go to append-only log arrays (character,
+    tick, moment), with each character's entries chained from a
+    per-character head through a next-entry array so one character's
+    history is read without scanning the log. Relationship statuses are
+    kept only for relationships that have changed, and each tick's events
+    are drawn per event rather than per character. step() reports only
+    the characters that changed.
+    """
+
+    def __init__(self, base_ages: Sequence[int], truths: Sequence[int],
+                 relationship_counts: Sequence[int],
+                 params: Optional[LoreParameters] = None,
+                 corpus: str = DEFAULT_CORPUS, seed: int = 0):
+        """Create a Population from Per-Character Columns
+
+        Args:
+            base_ages: Age of Each Character at Tick 0
+            truths: Corpus Hidden-Truth Index of Each Character (NO_TRUTH for none)
+            relationship_counts: Number of Relationships of Each Character
+            params: Parameters Driving Event Rates (defaults if None)
+            corpus: Corpus the Moments and Truths Come From
+            seed: Seed for Every Tick's Draws
+        """
+        if not len(base_ages) == len(truths) == len(relationship_counts):
+            raise ValueError("Population columns must all have the same length")
+        self.params = params or LoreParameters()
+        self.corpus = get_corpus(corpus)
+        self.seed = seed
+        self.tick = 0
+
+        self.base_ages = array("H", base_ages)
+        self.truths = array("B", truths)
+        self.revealed = bytearray(len(self.base_ages))
+        self.relationship_counts = array("B", relationship_counts)
+        self.statuses: Dict[Tuple[int, int], str] = {}
+
+        # Append-only moment log, chained per character: -1 ends a chain
+        self.moments = self.corpus.tragedy_moments + self.corpus.triumph_moments + self.corpus.revelation_moments
+        self.log_characters = array("I")
+        self.log_ticks = array("I")
+        self.log_moments = array("H")
+        self.log_next = array("i")
+        self.log_heads = array("i", [-1]) * len(self.base_ages)
+
+    @classmethod
+    def from_lores(cls, lores: Sequence[CharacterLore], params: Optional[LoreParameters] = None,
+                   corpus: str = DEFAULT_CORPUS, seed: int = 0) -> 'Population':
+        """Population Continuing from Generated Characters
+
+        Their starting moments are logged at tick 0, so later ticks never
+        give a character a moment it already has.
+        """
+        truth_positions = {truth: i for i, truth in enumerate(get_corpus(corpus).hidden_truths)}
+        population = cls(
+            [lore.age for lore in lores],
+            [truth_positions[lore.hidden_truth] if lore.hidden_truth else NO_TRUTH for lore in lores],
+            [len(lore.key_relationships) for lore in lores],
+            params, corpus, seed
+        )
+        moment_positions = {moment: i for i, moment in enumerate(population.moments)}
+        for index, lore in enumerate(lores):
+            for moment in lore.defining_moments:
+                if moment in moment_positions:
+                    population._log(index, 0, moment_positions[moment])
+        return population
+
+    @classmethod
+    def random(cls, count: int, params: Optional[LoreParameters] = None,
+               corpus: str = DEFAULT_CORPUS, seed: int = 0) -> 'Population':
+        """Population Drawn Directly into Columns, Without Building Characters
+
+        Ages, hidden truths and relationship counts follow the same
+        distributions as LoreGenerator.generate.
+        """
+        params = params or LoreParameters()
+        loaded = get_corpus(corpus)
+        rng = random.Random(f"{seed}:population")
+        ranges = [AGE_RANGES[archetype] for archetype in ARCHETYPES]
+        truths = len(loaded.hidden_truths)
+        relationships = min(params.relationship_weight, len(loaded.relationships))
+
+        base_ages = array("H", [rng.randint(*rng.choice(ranges)) for _ in range(count)])
+        hidden = array("B", [NO_TRUTH]) * count
+        for position in _event_positions(rng, count, params.mystery_factor):
+            hidden[position] = rng.randrange(truths)
+        return cls(base_ages, hidden, array("B", [relationships]) * count, params, corpus, seed)
+
+    def __len__(self) -> int:
+        return len(self.base_ages)
+
+    def age(self, index: int) -> int:
+        """Current Age of One Character"""
+        return self.base_ages[index] + self.tick
+
+    def step(self) -> List[CharacterDelta]:
+        """Advance One Year
+
+        Returns:
+            Deltas of the Characters That Changed, by Index
+        """
+        self.tick += 1
+        tick = self.tick
+        params = self.params
+        corpus = self.corpus
+        rng = random.Random(f"{self.seed}:tick:{tick}")
+        count = len(self.base_ages)
+        deltas: Dict[int, CharacterDelta] = {}
+
+        def delta(index: int) -> CharacterDelta:
+            entry = deltas.get(index)
+            if entry is None:
+                entry = deltas[index] = CharacterDelta(index, tick, self.base_ages[index] + tick)
+            return entry
+
+        # New defining moments
+        tragedies = len(corpus.tragedy_moments)
+        triumphs = len(corpus.triumph_moments)
+        for index in _event_positions(rng, count, MOMENT_RATE):
+            if rng.random() < params.tragedy_weight:
+                moment = rng.randrange(tragedies)
+            else:
+                moment = tragedies + rng.randrange(triumphs)
+            if self._log(index, tick, moment):
+                delta(index).new_moments.append(self.moments[moment])
+
+        # Hidden truths coming out, each with a revelation moment
+        truths = self.truths
+        revealed = self.revealed
+        revelations = len(corpus.revelation_moments)
+        for index in _event_positions(rng, count, REVEAL_RATE * (1 - params.mystery_factor)):
+            if truths[index] == NO_TRUTH or revealed[index]:
+                continue
+            revealed[index] = 1
+            moment = tragedies + triumphs + rng.randrange(revelations)
+            entry = delta(index)
+            if self._log(index, tick, moment):
+                entry.new_moments.append(self.moments[moment])
+            entry.revealed_truth = corpus.hidden_truths[truths[index]]
+
+        # New hidden truths for characters without one
+        for index in _event_positions(rng, count, SECRET_RATE * params.mystery_factor):
+            if truths[index] != NO_TRUTH:
+                continue
+            truths[index] = rng.randrange(len(corpus.hidden_truths))
+            delta(index).new_hidden_truth = corpus.hidden_truths[truths[index]]
+
+        # Relationships changing for the worse or the better
+        relationship_counts = self.relationship_counts
+        statuses = self.statuses
+        rate = RELATIONSHIP_RATE * params.relationship_weight / 5
+        for index in _event_positions(rng, count, rate):
+            relationships = relationship_counts[index]
+            if not relationships:
+                continue
+            slot = rng.randrange(relationships)
+            current = statuses.get((index, slot))
+            changes = WORSENS if rng.random() < params.tragedy_weight else IMPROVES
+            status = changes.get(current)
+            if status is None:
+                continue
+            statuses[(index, slot)] = status
+            delta(index).relationship_changes.append((slot, status))
+
+        return [deltas[index] for index in sorted(deltas)]
+
+    def _log(self, index: int, tick: int, moment: int) -> bool:
+        """Append a Moment to a Character's Chain Unless It Already Has It"""
+        log_moments = self.log_moments
+        log_next = self.log_next
+        last = -1
+        entry = self.log_heads[index]
+        while entry != -1:
+            if log_moments[entry] == moment:
+                return False
+            last = entry
+            entry = log_next[entry]
+
+        position = len(log_moments)
+        self.log_characters.append(index)
+        self.log_ticks.append(tick)
+        log_moments.append(moment)
+        log_next.append(-1)
+        if last == -1:
+            self.log_heads[index] = position
+        else:
+            log_next[last] = position
+        return True
+
+    def history(self, index: int) -> List[Tuple[int, str]]:
+        """(Tick, Moment) Entries Logged for One Character, Oldest First"""
+        entries = []
+        entry = self.log_heads[index]
+        while entry != -1:
+            entries.append((self.log_ticks[entry], self.moments[self.log_moments[entry]]))
+            entry = self.log_next[entry]
+        return entries
+
+    def evolve(self, lore: CharacterLore, index: int) -> CharacterLore:
+        """A Character as It Stands Now, Given How It Started
+
+        Args:
+            lore: The Character at Tick 0 (as Passed to from_lores)
+            index: Its Position in the Population
+
+        Returns:
+            Copy with the Current Age, Logged Moments Appended, Any New
+            Hidden Truth and Changed Relationship Statuses
+        """
+        moments = list(lore.defining_moments)
+        for _, moment in self.history(index):
+            if moment not in moments:
+                moments.append(moment)
+        truth = self.truths[index]
+        relationships = []
+        for slot, rel in enumerate(lore.key_relationships):
+            status = self.statuses.get((index, slot))
+            relationships.append(dict(rel, description = f"{rel['description']} ({status})") if status else rel)
+        evolved = replace(
+            lore,
+            age = self.age(index),
+            defining_moments = moments,
+            hidden_truth = self.corpus.hidden_truths[truth] if truth != NO_TRUTH else None,
+            key_relationships = relationships
+        )
+        evolved._has_placeholders = lore._has_placeholders or self.corpus.placeholders
+        return evolved
+
+def main():
+    count = 500000
+    start = time.perf_counter()
+    population = Population.random(count, seed = 1)
+    print(f"Built {count} characters in {time.perf_counter() - start:.2f}s")
+
+    for _ in range(10):
+        start = time.perf_counter()
+        deltas = population.step()
+        elapsed = time.perf_counter() - start
+        print(f"Year {population.tick:>2}: {len(deltas):>6} changed characters in {elapsed * 1000:.0f}ms")
+    print(f"Moment log: {len(population.log_moments)} entries")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+"""
+Streaming Export of Generated Characters
+"""
+
+import bz2
+import gzip
+import lzma
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from lore_generator import CharacterLore, ARCHETYPES, ORIGINS
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    zstd = None
+
+# Default compression level per codec
+COMPRESSION_LEVELS = {
+    "gzip": 6,
+    "bz2": 9,
+    "xz": 6,
+    "zstd": 3,
+}
+
+# File suffix per codec, used to guess the codec when reading
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+}
+
+INDEX_VERSION = 2
+INDEX_SUFFIX = ".idx"
+NAMES_SUFFIX = ".names"
+
+# magic, version, characters indexed, total in the export header;
+# then count + 1 little-endian uint64 offsets (the last one is where the
+# final character ends), then one archetype and one origin code byte per
+# character (UNKNOWN_CODE if written without its lore)
+INDEX_HEADER = struct.Struct("<4sHQQ")
+INDEX_MAGIC = b"LIDX"
+OFFSET = struct.Struct("<Q")
+SPAN = struct.Struct("<QQ")
+UNKNOWN_CODE = 0xFF
+
+ARCHETYPE_CODES = {archetype: i for i, archetype in enumerate(ARCHETYPES)}
+ORIGIN_CODES = {origin: i for i, origin in enumerate(ORIGINS)}
+
+HEADER = "# Generated Characters ({total} Total)\n\n---\n\n"
+CHARACTER_HEADING = "## Character {number}\n\n"
+SEPARATOR = "\n\n---\n\n"
+_SEPARATOR_BYTES = SEPARATOR.encode("utf-8")
+
+def guess_compression(path: str) -> Optional[str]:
+    """Guess the Compression Codec from a File Suffix"""
+    for suffix, compression in COMPRESSION_SUFFIXES.items():
+        if path.endswith(suffix):
+            return compression
+    return None
+
+def compression_suffix(compression: Optional[str]) -> str:
+    """File Suffix for a Compression Codec ("" for plain output)"""
+    for suffix, name in COMPRESSION_SUFFIXES.items():
+        if name == compression:
+            return suffix
+    return ""
+
+def open_output(path: str, mode: str = "wb",
+                compression: Optional[str] = None,
+                level: Optional[int] = None) -> BinaryIO:
+    """Open a Binary File, Optionally Through a Stdlib Compression Codec
+
+    Args:
+        path: File Path
+        mode: "wb" to write, "rb" to read
+        compression: "gzip", "bz2", "xz", "zstd" or None for plain output
+        level: Compression Level (codec default if None)
+
+    Returns:
+        Binary File Object
+    """
+    if compression is None:
+        return open(path, mode)
+    if compression not in COMPRESSION_LEVELS:
+        raise ValueError(f"Unknown compression: {compression}")
+
+    writing = "w" in mode
+    if level is None:
+        level = COMPRESSION_LEVELS[compression]
+
+    if compression == "gzip":
+        if writing:
+            return gzip.open(path, mode, compresslevel = level)
+        return gzip.open(path, mode)
+    if compression == "bz2":
+        if writing:
+            return bz2.open(path, mode, compresslevel = level)
+        return bz2.open(path, mode)
+    if compression == "xz":
+        if writing:
+            return lzma.open(path, mode, preset = level)
+        return lzma.open(path, mode)
+
+    if zstd is None:
+        raise ValueError("zstd compression requires Python 3.14 or newer")
+    if writing:
+        return zstd.open(path, mode, level = level)
+    return zstd.open(path, mode)
+
+class CharacterWriter:
+    """Writes Characters to a Markdown Export as They Are Generated
+
+    Produces the same layout as generate_characters.py, streaming each
+    character through the chosen codec instead of holding every narrative
+    in memory first. With index=True, an uncompressed export also gets a
+    sidecar index (see IndexedExport): names are streamed to a names file
+    as characters are written, and the binary offset and code table is
+    written when the file is closed.
+    """
+
+    def __init__(self, path: str, total: int,
+                 compression: Optional[str] = None,
+                 level: Optional[int] = None,
+                 index: bool = False):
+        if index and compression is not None:
+            raise ValueError("Only uncompressed exports can be indexed")
+        self.path = path
+        self.total = total
+        self.count = 0
+        self._file = open_output(path, "wb", compression, level)
+        header = HEADER.format(total = total).encode("utf-8")
+        self._file.write(header)
+        self._offset = len(header)
+        self._index = None
+        if index:
+            self._index = (array("Q", [self._offset]), bytearray(), bytearray())
+            self._names = open(path + NAMES_SUFFIX, "w", encoding = "utf-8")
+
+    def write(self, lore: CharacterLore) -> None:
+        """Write One Character"""
+        self.write_narrative(lore.to_narrative(), lore)
+
+    def write_narrative(self, narrative: str, lore: Optional[CharacterLore] = None) -> None:
+        """Write One Already Rendered Narrative
+
+        Args:
+            narrative: Rendered Character
+            lore: The Character It Was Rendered From, Recorded in the Index
+        """
+        self.count += 1
+        block = (CHARACTER_HEADING.format(number = self.count) + narrative + SEPARATOR).encode("utf-8")
+        self._file.write(block)
+        self._record(len(block), lore)
+
+    def write_encoded(self, narrative, lore: Optional[CharacterLore] = None) -> None:
+        """Write One Narrative Already Encoded as UTF-8
+
+        Args:
+            narrative: Any Bytes-Like Object, e.g. a memoryview into shared memory
+            lore: The Character It Was Rendered From, Recorded in the Index
+        """
+        self.count += 1
+        heading = CHARACTER_HEADING.format(number = self.count).encode("utf-8")
+        self._file.write(heading)
+        self._file.write(narrative)
+        self._file.write(_SEPARATOR_BYTES)
+        self._record(len(heading) + len(narrative) + len(_SEPARATOR_BYTES), lore)
+
+    def _record(self, length: int, lore: Optional[CharacterLore]) -> None:
+        """Advance the Offset and Add the Character Just Written to the Index"""
+        self._offset += length
+        if self._index is not None:
+            offsets, archetypes, origins = self._index
+            offsets.append(self._offset)
+            archetypes.append(ARCHETYPE_CODES[lore.archetype] if lore else UNKNOWN_CODE)
+            origins.append(ORIGIN_CODES[lore.origin] if lore else UNKNOWN_CODE)
+            self._names.write((lore.name.replace("\n", " ") if lore else "") + "\n")
+
+    def _write_index(self) -> None:
+        """Write the Binary Offset and Code Table"""
+        offsets, archetypes, origins = self._index
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        with open(self.path + INDEX_SUFFIX, "wb") as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, self.count, self.total))
+            f.write(offsets.tobytes())
+            f.write(archetypes)
+            f.write(origins)
+
+    def close(self) -> None:
+        """Flush and Close the Output File"""
+        self._file.close()
+        if self._index is not None:
+            self._names.close()
+            self._write_index()
+
+    def __enter__(self) -> 'CharacterWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+def read_characters(path: str,
+                    compression: Optional[str] = "auto") -> Iterator[Tuple[int, str]]:
+    """Stream Characters Back Out of an Export
+
+    Args:
+        path: Export File Path
+        compression: Codec name, None for plain files, or "auto" to guess from the suffix
+
+    Yields:
+        (Character Number, Narrative) Pairs in File Order
+    """
+    if compression == "auto":
+        compression = guess_compression(path)
+
+    heading = "## Character "
+    number = None
+    lines = []
+
+    with open_output(path, "rb", compression) as f:
+        for raw in f:
+            line = raw.decode("utf-8")
+            if line.startswith(heading) and line[len(heading):].strip().isdigit():
+                if number is not None:
+                    yield number, _strip_block(lines)
+                number = int(line[len(heading):])
+                lines = []
+            elif number is not None:
+                lines.append(line)
+
+    if number is not None:
+        yield number, _strip_block(lines)
+
+def _strip_block(lines) -> str:
+    """Remove the Blank Line After a Heading and the Trailing Separator"""
+    block = "".join(lines)
+    if block.startswith("\n"):
+        block = block[1:]
+    if block.endswith(SEPARATOR):
+        block = block[:-len(SEPARATOR)]
+    return block
+
+class IndexedExport:
+    """Random Access to an Indexed Export Through Its Sidecar Index
+
+    The offset table is memory-mapped and read by position, so opening an
+    export and seeking to any character costs the same however many
+    characters it holds. Filters scan the one-byte archetype and origin
+    columns, and the table of contents streams the names file; neither
+    touches the export itself.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._index = None
+        self._table = open(path + INDEX_SUFFIX, "rb")
+        try:
+            # mmap refuses empty files, so check the size before mapping
+            if os.fstat(self._table.fileno()).st_size < INDEX_HEADER.size:
+                raise ValueError(f"{path}{INDEX_SUFFIX} is not a version {INDEX_VERSION} index")
+            self._index = mmap.mmap(self._table.fileno(), 0, access = mmap.ACCESS_READ)
+            magic, version, self._count, self.total = INDEX_HEADER.unpack_from(self._index)
+            if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                raise ValueError(f"{path}{INDEX_SUFFIX} is not a version {INDEX_VERSION} index")
+            self._archetypes_at = INDEX_HEADER.size + OFFSET.size * (self._count + 1)
+            self._origins_at = self._archetypes_at + self._count
+            if len(self._index) < self._origins_at + self._count:
+                raise ValueError(f"{path}{INDEX_SUFFIX} is truncated")
+            self._file = open(path, "rb")
+        except BaseException:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        return self._count
+
+    def span(self, number: int) -> Tuple[int, int]:
+        """Byte Offset and Length of Character number's Block"""
+        if not 1 <= number <= self._count:
+            raise IndexError("character number out of range")
+        start, end = SPAN.unpack_from(self._index, INDEX_HEADER.size + OFFSET.size * (number - 1))
+        return start, end - start
+
+    def read(self, number: int) -> str:
+        """Narrative of Character number (1-based, as in the Headings)"""
+        offset, length = self.span(number)
+        self._file.seek(offset)
+        block = self._file.read(length).decode("utf-8")
+        heading = CHARACTER_HEADING.format(number = number)
+        return block[len(heading):-len(SEPARATOR)]
+
+    def numbers(self, archetype: Optional[str] = None,
+                origin: Optional[str] = None) -> List[int]:
+        """Character Numbers Matching an Archetype and/or Origin Value"""
+        filters = []
+        for value, values, column in ((archetype, ARCHETYPES, self._archetypes_at),
+                                      (origin, ORIGINS, self._origins_at)):
+            if value is None:
+                continue
+            codes = [i for i, member in enumerate(values) if member.value == value]
+            if not codes:
+                return []
+            filters.append((bytes(codes), column))
+        if not filters:
+            return list(range(1, self._count + 1))
+
+        index = self._index
+        (code, column), checks = filters[0], filters[1:]
+        end = column + self._count
+        numbers = []
+        position = index.find(code, column, end)
+        while position != -1:
+            number = position - column
+            if all(index[other + number] == other_code[0] for other_code, other in checks):
+                numbers.append(number + 1)
+            position = index.find(code, position + 1, end)
+        return numbers
+
+    def select(self, archetype: Optional[str] = None,
+               origin: Optional[str] = None) -> Iterator[Tuple[int, str]]:
+        """Read Only the Characters Matching an Archetype and/or Origin Value"""
+        for number in self.numbers(archetype, origin):
+            yield number, self.read(number)
+
+    def table_of_contents(self) -> str:
+        """Markdown Table of Contents Built from the Index Alone"""
+        index = self._index
+        lines = [f"# Generated Characters ({self.total} Total)", ""]
+        with open(self.path + NAMES_SUFFIX, "r", encoding = "utf-8") as names:
+            for number, name in enumerate(names, 1):
+                if number > self._count:
+                    break
+                entry = f"- [Character {number}](#character-{number})"
+                archetype = index[self._archetypes_at + number - 1]
+                if archetype != UNKNOWN_CODE:
+                    origin = index[self._origins_at + number - 1]
+                    entry += f": {name[:-1]} ({ARCHETYPES[archetype].value}, {ORIGINS[origin].value})"
+                lines.append(entry)
+        return "\n".join(lines) + "\n"
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        if self._index is not None:
+            self._index.close()
+        self._table.close()
+
+    def __enter__(self) -> 'IndexedExport':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
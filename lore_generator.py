@@ -1,8 +1,15 @@
 import random
-from dataclasses import dataclass
-from typing import List, Optional, Dict
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Dict, Callable, Iterable, Iterator, Tuple
 from enum import Enum
 import json
+import hashlib
+import copy
+import threading
+import sys
+import os
+import weakref
+from string import Formatter
 
 class Archetype(Enum):
     """Defines Character Archetypes"""
@@ -26,6 +33,47 @@ class Origin(Enum):
     ACADEMIC = "Academic"
     MYSTIC = "Mystic"
 
+# Age range by archetype
+AGE_RANGES = {
+    Archetype.HERO: (16, 25),
+    Archetype.ANTIHERO: (25, 40),
+    Archetype.MENTOR: (60, 85),
+    Archetype.TRICKSTER: (14, 30),
+    Archetype.GUARDIAN: (35, 60),
+    Archetype.VILLAIN: (25, 60),
+    Archetype.OUTCAST: (18, 40),
+    Archetype.SCHOLAR: (24, 70)
+}
+
+ARCHETYPES = list(Archetype)
+ORIGINS = list(Origin)
+
+# Character fields a corpus string may refer to, e.g. "Who betrayed {name} at {birthplace}"
+PLACEHOLDER_FIELDS = ("name", "age", "archetype", "origin", "birthplace")
+
+def _fill(text: str, lore: 'CharacterLore') -> str:
+    """Substitute a Character's Fields for the Placeholders in a Corpus String"""
+    if "{" not in text:
+        return text
+    return text.format(
+        name = lore.name,
+        age = lore.age,
+        archetype = lore.archetype.value,
+        origin = lore.origin.value,
+        birthplace = _fill(lore.birthplace, lore) if text is not lore.birthplace else "",
+    )
+
+def _placeholders(text: str) -> List[str]:
+    """Field Names Referred to by a Corpus String"""
+    fields = []
+    for _, field_name, spec, conversion in Formatter().parse(text):
+        if field_name is None:
+            continue
+        if spec or conversion:
+            raise ValueError(f"Format specs are not supported: {{{field_name}}}")
+        fields.append(field_name)
+    return fields
+
 @dataclass
 class LoreParameters:
     """Adjustable Parameters for Lore Generation"""
@@ -83,8 +131,78 @@ class CharacterLore:
 
     key_relationships: List[Dict[str, str]]
 
+    # Rendered narrative sections, filled by cached_narrative(); not a field,
+    # so asdict(), comparison and pickling leave it out
+    _rendered = None
+    # Set when the character was built from a corpus with placeholders, so
+    # rendering knows to fill them without looking at every string
+    _has_placeholders = False
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_rendered", None)
+        return state
+
+    def _render_header(self) -> str:
+        return f"# {self.name}\n"
+
+    def _render_identity(self) -> str:
+        return "\n".join([
+            "## Identity",
+            f"Age: {self.age}",
+            f"Archetype: {self.archetype.value}",
+            f"Personality: {', '.join(self.personality_traits)}",
+            f"Distinctive Features: {self.distinctive_features}\n",
+        ])
+
+    def _render_background(self) -> str:
+        return "\n".join([
+            "## Background",
+            f"Origin: {self.origin.value}",
+            f"Birthplace: {self.birthplace}\n",
+        ])
+
+    def _render_moments(self) -> str:
+        lines = ["## Defining Moments"]
+        for i, moment in enumerate(self.defining_moments, 1):
+            lines.append(f"{i}. {moment}")
+        lines.append("")
+        return "\n".join(lines)
+
+    def _render_psychology(self) -> str:
+        lines = [
+            "## Psychology",
+            f"Core Motivation: {self.core_motivation}",
+            f"Fatal Flaw: {self.fatal_flaw}",
+            f"Greatest Fear: {self.greatest_fear}",
+            f"Internal Conflict: {self.internal_conflict}",
+        ]
+        if self.hidden_truth:
+            lines.append(f"Hidden Truth: {self.hidden_truth}")
+        return "\n".join(lines)
+
+    def _render_relationships(self) -> str:
+        if not self.key_relationships:
+            return ""
+        lines = ["\n## Relationships"]
+        for rel in self.key_relationships:
+            lines.append(f"- **{rel['name']}** ({rel['role']}): {rel['description']}")
+        lines.append("")
+        return "\n".join(lines)
+
     def to_narrative(self) -> str:
-        """Converts Lore to Narrative Format"""
+        """Converts Lore to Narrative Format
+
+        Corpus placeholders such as {name} are filled in with this
+        character's fields if it was generated or decoded from a corpus
+        that has any.
+        """
+        if self._has_placeholders:
+            return _filled(self)._narrative()
+        return self._narrative()
+
+    def _narrative(self) -> str:
+        """Narrative Format Without Filling Placeholders"""
         sections = []
 
         sections.append(f"# {self.name}\n")
@@ -117,842 +235,1291 @@ class CharacterLore:
             for rel in self.key_relationships:
                 sections.append(f"- **{rel['name']}** ({rel['role']}): {rel['description']}")
             sections.append("")
-        
+
         return "\n".join(sections)
 
-class LoreGenerator:
-    """Main Character Lore Generator"""
+    def cached_narrative(self) -> str:
+        """Narrative Format, Re-Rendering Only Sections Not Rendered Before
 
-    def __init__(self, params: Optional[LoreParameters] = None):
-        self.params = params or LoreParameters.default()
-        self._load_generation_data()
-
-    def _load_generation_data(self):
-        """Load All the Generation Data"""
-
-        # Names by origin
-        self.names = {
-            Origin.NOBLE: [
-                "Ada",
-                "Adalbern",
-                "Adalbert",
-                "Adalfarus",
-                "Adalgard",
-                "Adaline",
-                "Adalwin",
-                "Adelina",
-                "Aenor",
-                "Alaric",
-                "Aldina",
-                "Alistair",
-                "Alphonzo",
-                "Athena",
-                "Baal",
-                "Baldric",
-                "Belinda",
-                "Bujar",
-                "Cecily",
-                "Cedric",
-                "Charlotte",
-                "Clytemnestra",
-                "Conrad",
-                "Constantine",
-                "Delphine",
-                "Dimitri",
-                "Dorian",
-                "Edelmiro",
-                "Eleanor",
-                "Elric",
-                "Folasade",
-                "Gabriel",
-                "Generosa",
-                "Gideon",
-                "Giselle",
-                "Herleva",
-                "Isabella",
-                "Ketevan",
-                "Klytios",
-                "Maëly",
-                "Makram",
-                "Maria",
-                "Maximilian",
-                "Melisande",
-                "Mordecai",
-                "Nabil",
-                "Otto",
-                "Patrekur",
-                "Raine",
-                "Raphaela",
-                "Willa",
-                "Yorath"
-                ],
-
-            Origin.COMMONER: [
-                "Agatha",
-                "Adam",
-                "Alan",
-                "Agnes",
-                "Amice",
-                "Andrew",
-                "Annabel",
-                "Anthony",
-                "Beatrice",
-                "Bernard",
-                "Bert",
-                "Benjamin",
-                "Cathy",
-                "Clement",
-                "Denise",
-                "David",
-                "Daniel",
-                "Ellen",
-                "Edward",
-                "Fiona",
-                "Frank",
-                "Grace",
-                "George",
-                "Hannah",
-                "Henry",
-                "Irene",
-                "Jack",
-                "Jane",
-                "Kevin",
-                "Laura",
-                "Michael",
-                "Mary",
-                "Nathan",
-                "Olivia",
-                "Paul",
-                "Rachel",
-                "Richard",
-                "Sarah",
-                "Steven",
-                "Susan",
-                "Thomas",
-                "Tim",
-                "William"
-                ],
-
-            Origin.ORPHAN: [
-                "Aria",
-                "Angela",
-                "Annie",
-                "Bobby",
-                "Betsy",
-                "Brenda",
-                "Cossette",
-                "Charlie",
-                "Cindy",
-                "Dinky",
-                "Dolly",
-                "Eddie",
-                "Emily",
-                "Elora",
-                "Fanny",
-                "Freddie",
-                "Gina",
-                "Gus",
-                "Holly",
-                "Harry",
-                "Huey",
-                "Karai",
-                "Kiki",
-                "Lucky",
-                "Lola",
-                "Maggie",
-                "Nami",
-                "Nico",
-                "Parker",
-                ],
-
-            Origin.EXILE: [
-                "Avah",
-                "Bastian",
-                "Cyrus",
-                "Dahlia",
-                "Durk",
-                "Eira",
-                "Ezekiel",
-                "Freyja",
-                "Gunther",
-                "Harvey",
-                "Heck",
-                "Jeb",
-                "Johnnie",
-                "Kandi",
-                "Klaus",
-                "Lazlo",
-                "Luna",
-                "Mick",
-                "Spike",
-                "Tex",
-                "Tottie",
-                "Woodie"
-                ],
-
-            Origin.CRIMINAL: [
-                "Adolfito",
-                "Ali",
-                "Chuckie",
-                "Django",
-                "Gholam",
-                "Gobnet",
-                "Jaxx",
-                "Katarina",
-                "Lazaro",
-                "Lupo",
-                "Mara",
-                "Maverick",
-                "Nina",
-                "Rico",
-                "Rosa",
-                "Salvatore",
-                "Sombra",
-                "Talon",
-                ],
-
-            Origin.MILITARY: [
-                "Aleksandr",
-                "Alfred",
-                "Ambrose",
-                "Amir",
-                "Anastasia",
-                "Andrei",
-                "Anika",
-                "Anton",
-                "Artemis",
-                "Boris",
-                "Bruno",
-                "Charlemagne",
-                "Claude",
-                "Dmitry",
-                "Elazar",
-                "Emil",
-                "Ferdinand",
-                "Francis",
-                "Friedrich",
-                "Gaius",
-                "Geronimo",
-                "Gustav",
-                "Hector",
-                "Idris",
-                "Joseph",
-                "Lyudmila",
-                "Marie",
-                "Maurice",
-                "Valeriy"
-                ],
-
-            Origin.ACADEMIC: [
-                "Abraham",
-                "Ada",
-                "Adam",
-                "Adolf",
-                "Ahmad",
-                "Alan",
-                "Alexander",
-                "Alexis",
-                "Ali",
-                "Amalie",
-                "Anne",
-                "Antoine",
-                "Arthur",
-                "Bernhard",
-                "Blaise",
-                "Cassius",
-                "Christoph",
-                "Claudius",
-                "Denis",
-                "Domenico",
-                "Edmund",
-                "Erich",
-                "Ferdinand",
-                "Godfrey",
-                "Gottfried",
-                "Harold",
-                "Jay",
-                "Johannes",
-                "Ludwig",
-                "Mani",
-                "Oswald",
-                "Pascal",
-                ],
-
-            Origin.MYSTIC: [
-                "Amaterasu",
-                "Annei",
-                "Ashtoreth",
-                "Astarte",
-                "Dagan",
-                "Izanagi",
-                "Marduk",
-                "Marzanna",
-                "Morana",
-                "Morgana",
-                "Morena",
-                "Nabu",
-                "Nikolaos",
-                "Ningal",
-                ]
-        }
+        Sections are cached on the character, so this assumes the lore is
+        not modified in place afterwards; LoreGenerator.reroll() returns a
+        new character that keeps the cache of every untouched section.
+        """
+        if self._rendered is None:
+            self._rendered = {}
+        rendered = self._rendered
+        missing = [section for section in _SECTION_RENDERERS if section not in rendered]
+        if missing:
+            source = _filled(self) if self._has_placeholders else self
+            for section in missing:
+                rendered[section] = _SECTION_RENDERERS[section](source)
+        return _join_sections(rendered)
+
+def _filled(lore: CharacterLore) -> CharacterLore:
+    """Copy of a Character with Placeholders in Its Corpus Strings Filled In"""
+    return replace(
+        lore,
+        distinctive_features = _fill(lore.distinctive_features, lore),
+        birthplace = _fill(lore.birthplace, lore),
+        defining_moments = [_fill(moment, lore) for moment in lore.defining_moments],
+        core_motivation = _fill(lore.core_motivation, lore),
+        fatal_flaw = _fill(lore.fatal_flaw, lore),
+        greatest_fear = _fill(lore.greatest_fear, lore),
+        internal_conflict = _fill(lore.internal_conflict, lore),
+        hidden_truth = _fill(lore.hidden_truth, lore) if lore.hidden_truth else lore.hidden_truth,
+        key_relationships = [dict(rel, description = _fill(rel["description"], lore))
+                             for rel in lore.key_relationships],
+    )
+
+# Narrative sections in output order
+_SECTION_RENDERERS = {
+    "header": CharacterLore._render_header,
+    "identity": CharacterLore._render_identity,
+    "background": CharacterLore._render_background,
+    "moments": CharacterLore._render_moments,
+    "psychology": CharacterLore._render_psychology,
+    "relationships": CharacterLore._render_relationships,
+}
+
+# Narrative section each field is rendered in
+FIELD_SECTIONS = {
+    "name": "header",
+    "age": "identity",
+    "archetype": "identity",
+    "personality_traits": "identity",
+    "distinctive_features": "identity",
+    "origin": "background",
+    "birthplace": "background",
+    "defining_moments": "moments",
+    "core_motivation": "psychology",
+    "fatal_flaw": "psychology",
+    "greatest_fear": "psychology",
+    "internal_conflict": "psychology",
+    "hidden_truth": "psychology",
+    "key_relationships": "relationships",
+}
+
+def _join_sections(sections: Dict[str, str]) -> str:
+    """Join Rendered Sections in Output Order, Skipping Empty Ones"""
+    return "\n".join([sections[section] for section in _SECTION_RENDERERS if sections[section]])
+
+# Sections every corpus provides
+SECTIONS = (
+    "names",
+    "personality_positive",
+    "personality_negative",
+    "personality_neutral",
+    "motivations",
+    "birthplaces",
+    "tragedy_moments",
+    "triumph_moments",
+    "revelation_moments",
+    "relationships",
+    "distinctive_features",
+    "fatal_flaws",
+    "greatest_fears",
+    "internal_conflicts",
+    "hidden_truths",
+)
+
+# One shared copy of every section content seen by any corpus
+_section_pool: Dict[str, object] = {}
+
+def _section_key(section) -> str:
+    """Canonical Text of a Section, Used to Find Shared Copies"""
+    if isinstance(section, dict):
+        section = {key.value if isinstance(key, Enum) else key: values for key, values in section.items()}
+    return json.dumps(section, sort_keys = True)
+
+def _freeze_section(name: str, section):
+    """Convert a Section to Its Immutable Form"""
+    if name == "names":
+        return {Origin(origin) if isinstance(origin, str) else origin: tuple(map(sys.intern, values))
+                for origin, values in section.items()}
+    if name == "motivations":
+        return {Archetype(archetype) if isinstance(archetype, str) else archetype: tuple(map(sys.intern, values))
+                for archetype, values in section.items()}
+    if name == "relationships":
+        return tuple(
+            {"role": sys.intern(rel["role"]), "descriptions": tuple(map(sys.intern, rel["descriptions"]))}
+            for rel in section
+        )
+    return tuple(map(sys.intern, section))
+
+def _check_section(corpus: str, name: str, section) -> None:
+    """Raise ValueError Unless a Section Has the Shape and Entries Generation Draws From"""
+    def check_entries(label: str, entries) -> None:
+        if not isinstance(entries, (list, tuple)) or not entries:
+            raise ValueError(f"Corpus {corpus!r} {label} must be a non-empty list")
+        for entry in entries:
+            if not isinstance(entry, str):
+                raise ValueError(f"Corpus {corpus!r} {label} entry {entry!r} is not a string")
+
+    if name in ("names", "motivations"):
+        if not isinstance(section, dict):
+            raise ValueError(f"Corpus {corpus!r} {name} must map each key to a list")
+        for key, entries in section.items():
+            check_entries(f"{name}[{key.value if isinstance(key, Enum) else key!r}]", entries)
+    elif name == "relationships":
+        if not isinstance(section, (list, tuple)) or not section:
+            raise ValueError(f"Corpus {corpus!r} relationships must be a non-empty list")
+        for rel in section:
+            if not isinstance(rel, dict) or not isinstance(rel.get("role"), str) or "descriptions" not in rel:
+                raise ValueError(f"Corpus {corpus!r} relationship {rel!r} needs a role and descriptions")
+            check_entries(f"relationships[{rel['role']!r}] descriptions", rel["descriptions"])
+    else:
+        check_entries(name, section)
+
+def _shared_section(name: str, section):
+    """Freeze a Section and Reuse an Identical Copy if One Is Already Loaded"""
+    section = _freeze_section(name, section)
+    key = name + ":" + _section_key(section)
+    return _section_pool.setdefault(key, section)
+
+def _prune_section_pool() -> None:
+    """Drop Pooled Sections No Loaded Corpus Uses Any More"""
+    live = {id(getattr(corpus, section)) for corpus in list(_corpora.values()) for section in SECTIONS}
+    for key, section in list(_section_pool.items()):
+        if id(section) not in live:
+            _section_pool.pop(key, None)
+
+class Corpus:
+    """Read-Only Tables a Generator Draws From
+
+    Sections with identical content are shared between corpora, so
+    settings that only replace a few sections cost only those sections.
+    """
+
+    def __init__(self, name: str, sections: dict, frozen: Iterable[str] = ()):
+        """Build a Corpus
 
-        # Personality traits
-        self.personality_positive = [
-            "Assertive",
-            "Astute",
-            "Decisive",
-            "Eloquent",
-            "Innovative",
-            "Intuitive",
-            "Logical",
-            "Pioneering",
-            "Practical",
-            "Pragmatic",
-            "Rational",
-            "Realistic",
-            "Resilient",
-            "Reflective",
-            "Resourceful",
-            "Self-disciplined",
-            "Spirited",
-            "Unwavering",
-            "Visionary",
-            "Creative",
-            "Eccentric",
-            "Adventurous",
-            "Caring",
-            "Charismatic",
-            "Caring",
-            "Confident",
-            "Cooperative",
-            "Generous",
-            "Gracious",
-            "Honest",
-            "Humorous",
-            "Loyal",
-            "Optimistic",
-            "Passionate",
-            "Patient",
-            "Punctual",
-            "Sociable",
-            "Supportive",
-            "Forgiving",
-            "Friendly",
-            "Humble",
-            "Sincere",
-            "Trustworthy",
-        ]
-        
-        self.personality_negative = [
-            "Aggressive",
-            "Arrogant",
-            "Apathetic",
-            "Arrogant",
-            "Boastful",
-            "Careless",
-            "Complacent",
-            "Conceited",
-            "Cowardly",
-            "Cruel",
-            "Deceitful",
-            "Defensive",
-            "Defiant",
-            "Distrustful",
-            "Disloyal",
-            "Disrespectful",
-            "Domineering",
-            "Egotistical",
-            "Envious",
-            "Greedy",
-            "Hypocritical",
-            "Impulsive",
-            "Inconsiderate",
-            "Inflexible",
-            "Invasive",
-            "Judgmental",
-            "Malicious",
-            "Manipulative",
-            "Materialistic",
-            "Narcissistic",
-            "Narrow-minded",
-            "Obnoxious",
-            "Pessimistic",
-            "Reckless",
-            "Ruthless",
-            "Spiteful",
-            "Stubborn",
-            "Vengeful",
-            "Vindictive",
-        ]
-        
-        self.personality_neutral = [
-            "Analytical",
-            "Blunt",
-            "Cautious",
-            "Conscientious",
-            "Curious",
-            "Candid",
-            "Competitive",
-            "Decisive",
-            "Direct",
-            "Flexible",
-            "Independent",
-            "Inquisitive",
-            "Methodical",
-            "Objective",
-            "Observant",
-            "Perceptive",
-            "Practical",
-            "Perfectionist",
-            "Rational",
-            "Reflective",
-            "Reserved",
-            "Spontaneous",
-            "Studious",
-            "Sensitive",
-            "Quiet"
-        ]
+        Args:
+            name: Corpus Name
+            sections: Section Name -> Table
+            frozen: Sections Already Taken from Another Corpus, Used As-Is
+        """
+        missing = [section for section in SECTIONS if section not in sections]
+        if missing:
+            raise ValueError(f"Corpus {name!r} is missing sections: {', '.join(missing)}")
+
+        self.name = name
+        frozen = set(frozen)
+        for section in SECTIONS:
+            if section not in frozen:
+                _check_section(name, section, sections[section])
+        for section in SECTIONS:
+            table = sections[section]
+            setattr(self, section, table if section in frozen else _shared_section(section, table))
+
+        missing = [origin.value for origin in Origin if not self.names.get(origin)]
+        missing += [archetype.value for archetype in Archetype if not self.motivations.get(archetype)]
+        if missing:
+            raise ValueError(f"Corpus {name!r} has no entries for: {', '.join(missing)}")
+
+        # Pool for the optional fourth trait
+        self.extra_traits = self.personality_positive + self.personality_neutral
+
+        self.placeholders = False
+        for section, text in self.rendered_strings():
+            fields = _placeholders(text)
+            unknown = [f for f in fields if f not in PLACEHOLDER_FIELDS or (f == "birthplace" and section == "birthplaces")]
+            if unknown:
+                raise ValueError(f"Corpus {name!r} {section} entry {text!r} has unknown placeholders: "
+                                 f"{', '.join('{' + f + '}' for f in unknown)}")
+            self.placeholders = self.placeholders or bool(fields)
+
+        self.version = self._hash()
+
+    def rendered_strings(self) -> Iterator[Tuple[str, str]]:
+        """(Section, Entry) for Every Entry That May Hold Placeholders"""
+        for section in ("birthplaces", "tragedy_moments", "triumph_moments", "revelation_moments",
+                        "distinctive_features", "fatal_flaws", "greatest_fears",
+                        "internal_conflicts", "hidden_truths"):
+            for text in getattr(self, section):
+                yield section, text
+        for motivations in self.motivations.values():
+            for text in motivations:
+                yield "motivations", text
+        for rel in self.relationships:
+            for text in rel["descriptions"]:
+                yield "relationships", text
+
+    def sections(self) -> dict:
+        """Section Name -> Table"""
+        return {section: getattr(self, section) for section in SECTIONS}
+
+    def _hash(self) -> str:
+        """Short Content Hash Identifying This Corpus"""
+        data = {section: json.loads(_section_key(table)) for section, table in self.sections().items()}
+        encoded = json.dumps(data, sort_keys = True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+# Registered corpus loaders, their base corpora and source files
+_corpus_loaders: Dict[str, Callable[[], dict]] = {}
+_corpus_bases: Dict[str, Optional[str]] = {}
+_corpus_paths: Dict[str, List[str]] = {}
+# Loaded corpora and the raw sections each was built from
+_corpora: Dict[str, Corpus] = {}
+_corpus_sources: Dict[str, dict] = {}
+_corpora_lock = threading.Lock()
+_reload_lock = threading.RLock()
+
+DEFAULT_CORPUS = "fantasy"
+
+def register_corpus(name: str, loader: Callable[[], dict],
+                    base: Optional[str] = None,
+                    paths: Optional[List[str]] = None) -> None:
+    """Register a Corpus to Be Loaded on First Use
+
+    Args:
+        name: Corpus Name (e.g. "sci-fi")
+        loader: Returns Section Name -> Table; may return only some sections
+        base: Corpus Supplying Every Section the Loader Leaves Out
+        paths: Files or Directories the Corpus Is Read From, for Reloading
+    """
+    with _corpora_lock:
+        _corpus_loaders[name] = loader
+        _corpus_bases[name] = base
+        _corpus_paths[name] = list(paths or [])
+        _corpora.pop(name, None)
+        _corpus_sources.pop(name, None)
+
+def _read_sections(path: str) -> dict:
+    """Read a JSON File of Sections"""
+    with open(path, "r", encoding = "utf-8") as f:
+        sections = json.load(f)
+    unknown = [section for section in sections if section not in SECTIONS]
+    if unknown:
+        raise ValueError(f"{path} has unknown sections: {', '.join(unknown)}")
+    return sections
+
+def register_corpus_file(name: str, path: str,
+                         base: Optional[str] = DEFAULT_CORPUS) -> None:
+    """Register a Corpus Stored in a JSON File
+
+    The file maps section names to tables. Names are keyed by origin
+    ("Noble") and motivations by archetype ("Hero"); sections left out of
+    the file come from the base corpus.
+    """
+    register_corpus(name, lambda: _read_sections(path), base, [path])
+
+def register_corpus_dir(name: str, path: str,
+                        base: Optional[str] = DEFAULT_CORPUS) -> None:
+    """Register a Corpus Stored as One JSON File per Section
+
+    The directory holds files such as names.json and fatal_flaws.json, each
+    containing one table. Only files that changed since the last load are
+    parsed again.
+    """
+    parsed = {}
+
+    def loader() -> dict:
+        sections = {}
+        for section in SECTIONS:
+            file = os.path.join(path, section + ".json")
+            try:
+                mtime = os.stat(file).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            cached = parsed.get(section)
+            if cached is None or cached[0] != mtime:
+                with open(file, "r", encoding = "utf-8") as f:
+                    cached = (mtime, json.load(f))
+                parsed[section] = cached
+            sections[section] = cached[1]
+        return sections
+
+    register_corpus(name, loader, base, [path])
+
+def _build_corpus(name: str) -> Tuple[Corpus, dict]:
+    """Load a Corpus, Rebuilding Only Sections That Changed Since Its Last Load"""
+    with _corpora_lock:
+        loader = _corpus_loaders.get(name)
+        base = _corpus_bases.get(name)
+        previous = _corpora.get(name)
+        previous_sources = _corpus_sources.get(name, {})
+    if loader is None:
+        raise KeyError(f"Unknown corpus: {name}")
+
+    sources = loader()
+    tables = get_corpus(base).sections() if base else {}
+    frozen = set(tables)
+    for section, table in sources.items():
+        if previous is not None and previous_sources.get(section) == table:
+            tables[section] = getattr(previous, section)
+            frozen.add(section)
+        else:
+            tables[section] = table
+            frozen.discard(section)
+
+    return Corpus(name, tables, frozen), sources
+
+def get_corpus(name: str = DEFAULT_CORPUS) -> Corpus:
+    """Corpus by Name, Loading It on First Use"""
+    corpus = _corpora.get(name)
+    if corpus is not None:
+        return corpus
+
+    corpus, sources = _build_corpus(name)
+    with _corpora_lock:
+        if name not in _corpora:
+            _corpora[name] = corpus
+            _corpus_sources[name] = sources
+        return _corpora[name]
+
+def reload_corpus(name: str) -> Corpus:
+    """Rebuild a Corpus from Its Sources and Swap It In
+
+    The new corpus is built completely before it replaces the old one, so
+    generate() calls already running keep using the old corpus and new
+    calls see the new one. Loaded corpora built on top of this one are
+    reloaded too, and section contents no loaded corpus uses any more are
+    dropped from the shared pool. If loading fails the old corpus stays in
+    place.
+    """
+    with _reload_lock:
+        corpus, sources = _build_corpus(name)
+        with _corpora_lock:
+            _corpora[name] = corpus
+            _corpus_sources[name] = sources
+            dependents = [other for other, base in _corpus_bases.items()
+                          if base == name and other in _corpora]
+            _prune_section_pool()
+        for other in dependents:
+            reload_corpus(other)
+        return corpus
+
+def corpus_paths(name: str) -> List[str]:
+    """Files or Directories a Registered Corpus Is Read From"""
+    return list(_corpus_paths.get(name, []))
+
+def corpus_names() -> List[str]:
+    """Names of All Registered Corpora"""
+    return list(_corpus_loaders)
+
+def _fantasy_sections() -> dict:
+    """Built-In Fantasy Corpus"""
+
+    # Names by origin
+    names = {
+        Origin.NOBLE: [
+            "Ada",
+            "Adalbern",
+            "Adalbert",
+            "Adalfarus",
+            "Adalgard",
+            "Adaline",
+            "Adalwin",
+            "Adelina",
+            "Aenor",
+            "Alaric",
+            "Aldina",
+            "Alistair",
+            "Alphonzo",
+            "Athena",
+            "Baal",
+            "Baldric",
+            "Belinda",
+            "Bujar",
+            "Cecily",
+            "Cedric",
+            "Charlotte",
+            "Clytemnestra",
+            "Conrad",
+            "Constantine",
+            "Delphine",
+            "Dimitri",
+            "Dorian",
+            "Edelmiro",
+            "Eleanor",
+            "Elric",
+            "Folasade",
+            "Gabriel",
+            "Generosa",
+            "Gideon",
+            "Giselle",
+            "Herleva",
+            "Isabella",
+            "Ketevan",
+            "Klytios",
+            "Maëly",
+            "Makram",
+            "Maria",
+            "Maximilian",
+            "Melisande",
+            "Mordecai",
+            "Nabil",
+            "Otto",
+            "Patrekur",
+            "Raine",
+            "Raphaela",
+            "Willa",
+            "Yorath"
+            ],
 
-        # Motivations by archetype
-        self.motivations = {
-            Archetype.HERO: [
-                "To fulfill a prophecy they were born into",
-                "To honor the sacrifice of someone who died protecting them",
-                "To find a cure for a plague devastating their homeland",
-                "To reunite a world torn apart by civil war",
-                "To break a generational curse that haunts their bloodline",
-                "To give a voice to those who have been silenced",
-                "To return something stolen from its rightful people",
-                "To earn back honor their family lost long ago",
-                "To keep a deathbed promise that grows heavier each day",
-                "To dismantle a system that preys on the powerless",
-                "To find the missing people no one else will search for",
-                "To repay a debt of kindness that once saved their life",
-                "To ensure a tragedy they witnessed never happens again",
-                "To reclaim a homeland that was taken by force",
-                "To build something worth defending in a world that only destroys",
-                "To be worthy of the trust others place in them",
-                "To confront the evil they were once too young to fight",
-                "To answer the call that everyone else is too afraid to answer",
-                "To protect the innocent from a threat that has been ignored for too long",
-                "To destroy a powerful government or organization that is oppressing people",
-                "To find a way to save someone they love who is dying or in danger",
-                "To fix a mistake they made in the past that had devastating consequences",
-                ],
-
-            Archetype.ANTIHERO: [
-                "To settle a personal score while the world sorts itself out", 
-                "To protect the few people left who haven't betrayed them", 
-                "To prove they can still do something good despite everything they've done wrong", 
-                "To repay a debt to someone who didn't deserve what happened to them", 
-                "To drag the truth into the light even if it makes them the villain", 
-                "To quiet the guilt that follows them like a second shadow", 
-                "To dismantle something rotten from the inside out", 
-                "To make amends without ever admitting they were wrong", 
-                "To finish a fight they didn't start but refuse to lose", 
-                "To destroy the thing they helped create before it hurts anyone else", 
-                "To walk the line between justice and vengeance and not care which side they fall on", 
-                "To take from the powerful and never apologize for it",
-                "To save someone who reminds them of who they used to be",
-                "To confront the part of themselves they pretend doesn't exist"
-                ],
-
-            Archetype.MENTOR: [
-                "To prepare someone for a burden they themselves could not carry", 
-                "To correct the mistakes they made with their first student", 
-                "To find a successor worthy of a dangerous inheritance", 
-                "To make peace with their legacy before the end comes", 
-                "To unburden themselves of secrets too heavy to carry alone", 
-                "To build something that outlasts their own mortality", 
-                "To watch the world change in ways they can no longer change it themselves", 
-                "To reconnect with the world through someone who still believes in it", 
-                "To delay an inevitable catastrophe by one more generation", 
-                "To ensure the survival of a tradition", 
-                "To prepare someone for a great challenge",
-                "To keep alive a tradition the world is trying to forget",
-                "To fulfill the final wish of someone who once mentored them"
-                ],
-
-            Archetype.TRICKSTER: [
-                "To cause chaos", 
-                "To challenge authority", 
-                "To entertain themselves", 
-                "To expose hypocrisy", 
-                "To outsmart others", 
-                "To find amusement in the misfortune of others", 
-                "To disrupt the status quo for fun", 
-                "To pull off a great heist or con", 
-                "To escape from a dangerous situation", 
-                "To create a memorable story about themselves", 
-                "To test the limits of their own cleverness", 
-                "To find a way to get what they want without getting caught"
-                ],
-
-            Archetype.GUARDIAN: [
-                "To defend a place that holds the memory of everyone they've lost", 
-                "To keep a sacred oath sworn to someone who can no longer hold them to it", 
-                "To protect a secret that would cause war if it were ever revealed", 
-                "To preserve the one safe place left in a world that has gone dark", 
-                "To prevent an ancient evil from being awakened by the careless or the ambitious", 
-                "To ensure that a powerful artifact never falls into the wrong hands", 
-                "To protect the innocent from a threat they don't even know exists", 
-                "To shelter those who have nowhere else to go",
-                "To safeguard a forbidden knowledge that is both dangerous and necessary",
-                "To protect a child whose existence threatens empires",
-                "To guard the truth until the world is wise enough to hear it"
-                ],
-
-            Archetype.VILLAIN: [
-                "To prove that the system only rewards cruelty, so they became the cruelest", 
-                "To ensure no one ever has power over them again", 
-                "To punish a society that stood by and watched them suffer", 
-                "To claim the throne that was denied to them by birthright", 
-                "To force the world to acknowledge their existence", 
-                "To expose the corruption that hides behind noble faces", 
-                "To achieve the immortality that makes all other concerns irrelevant", 
-                "To become so powerful that betrayal becomes impossible", 
-                "To complete the work of someone who was destroyed for trying", 
-                "To complete the work of someone who was destroyed for trying",
-                "To turn the very people who abandoned them into believers",
-                "To possess the one thing that was always kept out of their reach",
-                "To silence the voice in their head that says they are nothing",
-                "To make the world feel the same helplessness they once felt",
-                "To prove that mercy is an illusion the powerful use to control the weak",
-                "To collapse the divide between what is feared and what is worshipped",
-                "To become the monster the world already decided they were" 
-                ],
-
-            Archetype.OUTCAST: [
-                "To find a place where they are not defined by what made them different", 
-                "To prove that the people who cast them out were wrong about them", 
-                "To build a home in a world that refuses to give them one", 
-                "To find others like them and create a safe haven for those who are deemed unworthy or different by society", 
-                "To turn the thing that made them an outcast into their greatest strength",
-                "To earn acceptance without sacrificing what makes them who they are",
-                "To dismantle the rigid boundaries that decide who belongs and who doesn't",
-                "To make peace with the fact that they may never belong anywhere",
-                "To uncover the conspiracy that led to their banishment",
-                "To find the family they were separated from before they can remember",
-                "To discover the truth behind their exile that no one will tell them",
-                "To answer the question of whether they were cast out or set free"
+        Origin.COMMONER: [
+            "Agatha",
+            "Adam",
+            "Alan",
+            "Agnes",
+            "Amice",
+            "Andrew",
+            "Annabel",
+            "Anthony",
+            "Beatrice",
+            "Bernard",
+            "Bert",
+            "Benjamin",
+            "Cathy",
+            "Clement",
+            "Denise",
+            "David",
+            "Daniel",
+            "Ellen",
+            "Edward",
+            "Fiona",
+            "Frank",
+            "Grace",
+            "George",
+            "Hannah",
+            "Henry",
+            "Irene",
+            "Jack",
+            "Jane",
+            "Kevin",
+            "Laura",
+            "Michael",
+            "Mary",
+            "Nathan",
+            "Olivia",
+            "Paul",
+            "Rachel",
+            "Richard",
+            "Sarah",
+            "Steven",
+            "Susan",
+            "Thomas",
+            "Tim",
+            "William"
             ],
 
-            Archetype.SCHOLAR: [
-                "To decipher an ancient text that holds the key to a forgotten catastrophe", 
-                "To prove a theory that the academic establishment refuses to acknowledge", 
-                "To recover lost knowledge that was deliberately destroyed", 
-                "To complete the unfinished life's work of a mentor who died under mysterious circumstances", 
-                "To catalogue the last remnants of a dying civilization before they vanish",
-                "To unlock the secrets of a power source that could save or destroy everything",
-                "To answer the one question that has haunted them since childhood",
-                "To prevent dangerous knowledge from being weaponized by those who don't understand it",
-                "To solve the puzzle that drove their predecessor to madness",
-                "To untangle the web of misinformation that has corrupted a fundamental truth",
-                "To understand the nature of a curse or affliction that has no known origin",
-                "To decode the language of a species or entity that no one else believes is real"
-            ]
-        }
+        Origin.ORPHAN: [
+            "Aria",
+            "Angela",
+            "Annie",
+            "Bobby",
+            "Betsy",
+            "Brenda",
+            "Cossette",
+            "Charlie",
+            "Cindy",
+            "Dinky",
+            "Dolly",
+            "Eddie",
+            "Emily",
+            "Elora",
+            "Fanny",
+            "Freddie",
+            "Gina",
+            "Gus",
+            "Holly",
+            "Harry",
+            "Huey",
+            "Karai",
+            "Kiki",
+            "Lucky",
+            "Lola",
+            "Maggie",
+            "Nami",
+            "Nico",
+            "Parker",
+            ],
 
-        # Birthplaces
-        self.birthplaces = [
-            "A bustling city", 
-            "A remote village", 
-            "A noble estate", 
-            "A war-torn region", 
-            "A mystical forest", 
-            "A coastal town", 
-            "A hidden sanctuary", 
-            "A desolate wasteland",
-            "A mountain stronghold", 
-            "A nomadic tribe", 
-            "A secret society", 
-            "A magical academy", 
-            "A forgotten ruin", 
-            "A prosperous kingdom", 
-            "A cursed land", 
-            "A distant planet",
-            "A floating city", 
-            "A subterranean cavern", 
-            "A celestial realm", 
-            "A post-apocalyptic world", 
-            "A parallel dimension"
-        ]
+        Origin.EXILE: [
+            "Avah",
+            "Bastian",
+            "Cyrus",
+            "Dahlia",
+            "Durk",
+            "Eira",
+            "Ezekiel",
+            "Freyja",
+            "Gunther",
+            "Harvey",
+            "Heck",
+            "Jeb",
+            "Johnnie",
+            "Kandi",
+            "Klaus",
+            "Lazlo",
+            "Luna",
+            "Mick",
+            "Spike",
+            "Tex",
+            "Tottie",
+            "Woodie"
+            ],
 
-        # Defining moments
-        self.tragedy_moments = [
-            "Witnessing the death of a loved one", 
-            "Being betrayed by a close friend", 
-            "Suffering a great loss", 
-            "Facing a life-threatening illness", 
-            "Enduring a traumatic event",
-            "Being exiled from their home", 
-            "Losing everything they hold dear", 
-            "Failing to save someone important", 
-            "Being falsely accused of a crime", 
-            "Experiencing a devastating defeat",
-            "Uncovering a dark family secret", 
-            "Being betrayed by a mentor", 
-            "Facing a moral dilemma that leads to tragedy", 
-            "Sacrificing something precious for the greater good", 
-            "Being manipulated into causing harm to others"
-        ]
+        Origin.CRIMINAL: [
+            "Adolfito",
+            "Ali",
+            "Chuckie",
+            "Django",
+            "Gholam",
+            "Gobnet",
+            "Jaxx",
+            "Katarina",
+            "Lazaro",
+            "Lupo",
+            "Mara",
+            "Maverick",
+            "Nina",
+            "Rico",
+            "Rosa",
+            "Salvatore",
+            "Sombra",
+            "Talon",
+            ],
 
-        self.triumph_moments = [
-            "Saving someone from danger", 
-            "Overcoming a great obstacle", 
-            "Achieving a lifelong dream", 
-            "Defeating a powerful enemy", 
-            "Uniting warring factions",
-            "Discovering a hidden talent", 
-            "Forming a powerful alliance", 
-            "Outsmarting a formidable opponent", 
-            "Surviving against all odds", 
-            "Redeeming themselves in the eyes of others",
-            "Uncovering a long-lost artifact that changes the course of history", 
-            "Sacrificing their own happiness for the greater good and being celebrated as a hero", 
-            "Outwitting a cunning adversary and emerging victorious against all odds"
-        ]
+        Origin.MILITARY: [
+            "Aleksandr",
+            "Alfred",
+            "Ambrose",
+            "Amir",
+            "Anastasia",
+            "Andrei",
+            "Anika",
+            "Anton",
+            "Artemis",
+            "Boris",
+            "Bruno",
+            "Charlemagne",
+            "Claude",
+            "Dmitry",
+            "Elazar",
+            "Emil",
+            "Ferdinand",
+            "Francis",
+            "Friedrich",
+            "Gaius",
+            "Geronimo",
+            "Gustav",
+            "Hector",
+            "Idris",
+            "Joseph",
+            "Lyudmila",
+            "Marie",
+            "Maurice",
+            "Valeriy"
+            ],
 
-        self.revelation_moments = [
-            "Discovering a hidden truth about their past", 
-            "Realizing they were manipulated by someone they trusted", 
-            "Uncovering a conspiracy that changes their worldview", 
-            "Learning a shocking secret about their family", 
-            "Realizing they have a hidden power or destiny",
-            "Discovering that their greatest enemy is actually a close friend or family member", 
-            "Realizing that their core motivation is based on a false premise and having to reevaluate their goals", 
-            "Uncovering a hidden aspect of their identity that challenges everything they thought they knew about themselves"
-        ]
+        Origin.ACADEMIC: [
+            "Abraham",
+            "Ada",
+            "Adam",
+            "Adolf",
+            "Ahmad",
+            "Alan",
+            "Alexander",
+            "Alexis",
+            "Ali",
+            "Amalie",
+            "Anne",
+            "Antoine",
+            "Arthur",
+            "Bernhard",
+            "Blaise",
+            "Cassius",
+            "Christoph",
+            "Claudius",
+            "Denis",
+            "Domenico",
+            "Edmund",
+            "Erich",
+            "Ferdinand",
+            "Godfrey",
+            "Gottfried",
+            "Harold",
+            "Jay",
+            "Johannes",
+            "Ludwig",
+            "Mani",
+            "Oswald",
+            "Pascal",
+            ],
 
-        # Key relationships
-        self.relationships = [
-            {
-                "role": "Childhood Friend",
-                "descriptions": [
-                    "Who has been by their side through the best and worst of times",
-                    "Who knows all their secrets",
-                    "Who has always believed in them even when no one else did",
-                    "Who they lost touch with after a small argument that turned into a long-standing rift",
-                    "Who they reconnected with after years of separation and found that they had changed in ways they never expected",
-                    "Who they had a falling out with over a miscommunication where neither were capable of admitting they were wrong and it led to a permanent estrangement",
-                    "Who helped them get through their darkest moments",
-                    "Who they were never super close with, but always had a friendly relationship with and they always looked out for each other in small ways",
-                    "Who they had a brief romantic relationship with that ended amicably but they still care for each other deeply",
-                    "Who they had a brief romantic relationship with that ended badly and they haven't spoken since",
-                ]
-            },
-
-            {
-                "role": "Mentor",
-                "descriptions": [
-                    "Who taught them everything they know and shaped who they are today",
-                    "Who they looked up to and wanted to be like, but they tragically lost them and they have never been able to replace that influence in their life",
-                    "Who made them feel capable of more than just surviving and inspired them to pursue something greater than what has been expected of them",
-                    "Who they trusted wholeheartedly, but chose to part ways after a major disagreement that they could never resolve or communicate about effectively",
-                    "Who they viewed as a parental figure and has continued to stay by their side as a source of comfort, support, and guidance throughout their life",
-                    "Who forced them to confront their deepest fears in order to become stronger, and able to withstand the challenges they would undeniably face in the future",
-                    "Who committed their life to ensuring their survival and success, even at great personal cost",
-                    "Who encouraged them to embrace their abilities and potential, unintentionally leading them down a path that has caused them great pain and suffering"
-                ]
-            },
-
-            {
-                "role": "Partner in Crime",
-                "descriptions": [
-                    "Who they met on a random adventure and they just clicked, becoming inseparable partners in crime and mischief",
-                    "Who they met in a moment of chaos and they found peace in each other's company, forming a bond that has lasted through vast distances and long periods of separation",
-                    "Who they share a similar outlook on life with, finding comfort in someone who is so similar",
-                    "Who they would give their life for, but they have a complicated relationship with because they are so similar",
-                    "Who they can fully trust with their life, but can never fully open up emotionally to",
-                    "Who they share a similar past with, but they have a complicated realationship because of how they eventually grew up in different directions and situations",
-                    "Who they didn't trust at first, until they were in a situation where they had to rely on each other completely",
-                    "Who they met through a mutual friend, and quickly formed a deep understanding over the tragic events they have both experienced in their lives"
-                ]    
-            },
-
-            {
-                "role": "Rival",
-                "descriptions": [
-                    "Who indirectly pushes them to be better by being a constant source of competition and comparison",
-                    "Who wants everything they have and will stop at nothing to get it, making them a constant low-level threat and bothersome presence in their life",
-                    "Who was once a close friend, but jealousy and misunderstandings drove them apart and they have been bitter rivals ever since",
-                    "Who they used to look up to, but they have become brainwashed by a toxic ideology and is no longer capable of recognizing right from wrong",
-                    "Who they used to look up to, but they have become corrupted by power and greed",
-                    "Who they used to view as family, but they betrayed them in an unforgivable manner, and nothing can repair the damage",
-                    "Who seeks to destroy them and everything they care about, but underneath it all they hold a small fragment of admiration from the past"
-                ]    
-            },
-
-            {
-                "role": "Love Interest",
-                "descriptions": [
-                    "Who they met on a random adventure, and became inseparable partners in love and life, sharing an unbreakable bond that will last generations",
-                    "Who they will lay down their life for without a second thought",
-                    "Who makes their heart feel full, alive, and protected, in spite of the harsh and cruel world surrounding them",
-                    "Who uplifts their dreams and ambitions, encouraging them to be the best version of themselves while still accepting their flaws and imperfections",
-                    "Who reminds them that they are more than just the expectations and burdens they carry",
-                    "Who walks beside them through the darkest, toughest times, and makes them feel like they are capable of even the most impossible feats as long as they have each other",
-                    "Who always knows how to make them smile even after a long day, providing laughter and comfort in a dark world"
-                ] 
-            },
-
-            {
-                "role": "Mysterious Stranger",
-                "descriptions": [
-                    "Who appears in random moments of their life, offering cryptic, but valuable, advice that they don't understand until when they need it most",
-                    "Who they met in a moment of unexpected kindness, and they have been trying to repay the kindness offered ever since",
-                    "Who offers pieces of information about the future in exchange for small favors",
-                    "Who offers pieces of information about the past in exchange for small favors",
-                    "Who offers pieces of information about the present in exchange for small favors",
-                    "Who seems to know more about them than they know about themselves",
-                    "Who randomly appears in their life at moments of great need, offering tokens of help for a secret"
-                ]    
-            },
-        ]
+        Origin.MYSTIC: [
+            "Amaterasu",
+            "Annei",
+            "Ashtoreth",
+            "Astarte",
+            "Dagan",
+            "Izanagi",
+            "Marduk",
+            "Marzanna",
+            "Morana",
+            "Morgana",
+            "Morena",
+            "Nabu",
+            "Nikolaos",
+            "Ningal",
+            ]
+    }
+
+    # Personality traits
+    personality_positive = [
+        "Assertive",
+        "Astute",
+        "Decisive",
+        "Eloquent",
+        "Innovative",
+        "Intuitive",
+        "Logical",
+        "Pioneering",
+        "Practical",
+        "Pragmatic",
+        "Rational",
+        "Realistic",
+        "Resilient",
+        "Reflective",
+        "Resourceful",
+        "Self-disciplined",
+        "Spirited",
+        "Unwavering",
+        "Visionary",
+        "Creative",
+        "Eccentric",
+        "Adventurous",
+        "Caring",
+        "Charismatic",
+        "Caring",
+        "Confident",
+        "Cooperative",
+        "Generous",
+        "Gracious",
+        "Honest",
+        "Humorous",
+        "Loyal",
+        "Optimistic",
+        "Passionate",
+        "Patient",
+        "Punctual",
+        "Sociable",
+        "Supportive",
+        "Forgiving",
+        "Friendly",
+        "Humble",
+        "Sincere",
+        "Trustworthy",
+    ]
+    
+    personality_negative = [
+        "Aggressive",
+        "Arrogant",
+        "Apathetic",
+        "Arrogant",
+        "Boastful",
+        "Careless",
+        "Complacent",
+        "Conceited",
+        "Cowardly",
+        "Cruel",
+        "Deceitful",
+        "Defensive",
+        "Defiant",
+        "Distrustful",
+        "Disloyal",
+        "Disrespectful",
+        "Domineering",
+        "Egotistical",
+        "Envious",
+        "Greedy",
+        "Hypocritical",
+        "Impulsive",
+        "Inconsiderate",
+        "Inflexible",
+        "Invasive",
+        "Judgmental",
+        "Malicious",
+        "Manipulative",
+        "Materialistic",
+        "Narcissistic",
+        "Narrow-minded",
+        "Obnoxious",
+        "Pessimistic",
+        "Reckless",
+        "Ruthless",
+        "Spiteful",
+        "Stubborn",
+        "Vengeful",
+        "Vindictive",
+    ]
+    
+    personality_neutral = [
+        "Analytical",
+        "Blunt",
+        "Cautious",
+        "Conscientious",
+        "Curious",
+        "Candid",
+        "Competitive",
+        "Decisive",
+        "Direct",
+        "Flexible",
+        "Independent",
+        "Inquisitive",
+        "Methodical",
+        "Objective",
+        "Observant",
+        "Perceptive",
+        "Practical",
+        "Perfectionist",
+        "Rational",
+        "Reflective",
+        "Reserved",
+        "Spontaneous",
+        "Studious",
+        "Sensitive",
+        "Quiet"
+    ]
+
+    # Motivations by archetype
+    motivations = {
+        Archetype.HERO: [
+            "To fulfill a prophecy they were born into",
+            "To honor the sacrifice of someone who died protecting them",
+            "To find a cure for a plague devastating their homeland",
+            "To reunite a world torn apart by civil war",
+            "To break a generational curse that haunts their bloodline",
+            "To give a voice to those who have been silenced",
+            "To return something stolen from its rightful people",
+            "To earn back honor their family lost long ago",
+            "To keep a deathbed promise that grows heavier each day",
+            "To dismantle a system that preys on the powerless",
+            "To find the missing people no one else will search for",
+            "To repay a debt of kindness that once saved their life",
+            "To ensure a tragedy they witnessed never happens again",
+            "To reclaim a homeland that was taken by force",
+            "To build something worth defending in a world that only destroys",
+            "To be worthy of the trust others place in them",
+            "To confront the evil they were once too young to fight",
+            "To answer the call that everyone else is too afraid to answer",
+            "To protect the innocent from a threat that has been ignored for too long",
+            "To destroy a powerful government or organization that is oppressing people",
+            "To find a way to save someone they love who is dying or in danger",
+            "To fix a mistake they made in the past that had devastating consequences",
+            ],
 
-        self.distinctive_features = [
-            "A prominent scar across their face", 
-            "A unique birthmark in the shape of a star", 
-            "Freckles that form a recognizable constellation",
-            "Piercing colored eyes that shine in the dark", 
-            "A distinctive tattoo that holds personal significance",
-            "An unusual hairstyle that sets them apart",
-            "A prosthetic limb that they have adapted to use with great skill", 
-            "A distinctive way of dressing that makes them easily identifiable", 
-            "A unique accent or way of speaking that is different from those around them",
-            "A physical deformity that they have learned to embrace as part of their identity", 
-            "A signature piece of jewelry that they always wear", 
-            "A distinctive laugh that is instantly recognizable", 
-            "A unique mannerism that others find endearing or unsettling",
-            "A unique hairstyle that only they can pull off",
-            "Colored hair that is not common in their world",
-            "No eyebrows or eyelashes",
-            "A voice that is unusually deep or high-pitched",
-            "An extra finger that they have learned to use with surprising dexterity",
-        ]
+        Archetype.ANTIHERO: [
+            "To settle a personal score while the world sorts itself out", 
+            "To protect the few people left who haven't betrayed them", 
+            "To prove they can still do something good despite everything they've done wrong", 
+            "To repay a debt to someone who didn't deserve what happened to them", 
+            "To drag the truth into the light even if it makes them the villain", 
+            "To quiet the guilt that follows them like a second shadow", 
+            "To dismantle something rotten from the inside out", 
+            "To make amends without ever admitting they were wrong", 
+            "To finish a fight they didn't start but refuse to lose", 
+            "To destroy the thing they helped create before it hurts anyone else", 
+            "To walk the line between justice and vengeance and not care which side they fall on", 
+            "To take from the powerful and never apologize for it",
+            "To save someone who reminds them of who they used to be",
+            "To confront the part of themselves they pretend doesn't exist"
+            ],
 
-        self.fatal_flaws = [
-            "Pride that blinds them to their own weaknesses", 
-            "A quick temper that leads to rash decisions", 
-            "A tendency to trust the wrong people", 
-            "An obsession with revenge that consumes them", 
-            "A fear of abandonment that causes them to push others away",
-            "A need for control that leads to micromanaging and alienating allies", 
-            "A tendency to take unnecessary risks in pursuit of their goals", 
-            "A deep-seated insecurity that undermines their confidence", 
-            "A stubborn refusal to change their ways even when it's clear they are wrong",
-            "A tendency to overthink and second-guess themselves to the point of inaction",
-            "A fear of failure that prevents them from taking necessary risks or pursuing their true potential",
-            "A tendency to forgive too easily, allowing others to take advantage of their kindness and generosity",
-            "A fear of intimacy that prevents them from forming close relationships",
-            "A tendency to overcomplicate things, making simple problems more difficult than they need to be",
-            "An obsession with needing to be wanted or needed by others, leading them to make sacrifices that ultimately harm themselves or those they care about",
-            "A tendency to overthink and analyze every situation from a negative perspective, leading to believing the worst about themselves and others, even when there is evidence to the contrary",
-            "A stubbornness that prevents them from admitting when they are wrong or accepting help from others, even when it would be in their best interest to do so",
-            "A tendency to get aggressive or defensive when they feel threatened, leading to escalating conflicts that could have been avoided with better communication or emotional regulation",
-            "A fear of being with someone that doesn't love them back, leading to unhealthy attachments or sabotaging potential relationships out of fear of rejection"
-        ]
+        Archetype.MENTOR: [
+            "To prepare someone for a burden they themselves could not carry", 
+            "To correct the mistakes they made with their first student", 
+            "To find a successor worthy of a dangerous inheritance", 
+            "To make peace with their legacy before the end comes", 
+            "To unburden themselves of secrets too heavy to carry alone", 
+            "To build something that outlasts their own mortality", 
+            "To watch the world change in ways they can no longer change it themselves", 
+            "To reconnect with the world through someone who still believes in it", 
+            "To delay an inevitable catastrophe by one more generation", 
+            "To ensure the survival of a tradition", 
+            "To prepare someone for a great challenge",
+            "To keep alive a tradition the world is trying to forget",
+            "To fulfill the final wish of someone who once mentored them"
+            ],
 
-        self.greatest_fears = [
-            "Being abandoned by those they care about with no explanation or warning", 
-            "Feeling excruciating loneliness even when surrounded by others", 
-            "Failure after putting everything and everyone on the line to achieve a goal they believed in", 
-            "Betrayal by someone that had been with them from the beginning and had been trusted implicitly", 
-            "Death to someone that didn't deserve it",
-            "Losing their sense of identity from a toxic relationship or environment", 
-            "Being powerless to protect those they care about", 
-            "Being powerful but unable to control their abilities or influence, causing unintended harm to others", 
-            "Being powerful, but powerless in the face of overwhelming odds or threats, causing devastation despite their best efforts",
-            "Facing the consequences of their actions that they believed were justified", 
-            "Being forgotten or erased from history despite their significant contributions and sacrifices",
-            "Never living up to their potential despite their best efforts",
-            "Never living up to the expectations they set for themselves",
-            "Facing the inevitability of their own humanity and mortality",
-            "Having to make a choice between two equally difficult paths",
-            "Having to make a choice between saving someone they love and achieving a goal that could save many others",
-        ]
+        Archetype.TRICKSTER: [
+            "To cause chaos", 
+            "To challenge authority", 
+            "To entertain themselves", 
+            "To expose hypocrisy", 
+            "To outsmart others", 
+            "To find amusement in the misfortune of others", 
+            "To disrupt the status quo for fun", 
+            "To pull off a great heist or con", 
+            "To escape from a dangerous situation", 
+            "To create a memorable story about themselves", 
+            "To test the limits of their own cleverness", 
+            "To find a way to get what they want without getting caught"
+            ],
 
-        self.internal_conflicts = [
-            "Struggling between their desire for revenge and their need for redemption", 
-            "Torn between their loyalty to their family and their personal ambitions", 
-            "Grappling with feelings of guilt over past mistakes while trying to move forward", 
-            "Torn between their desire for power and their fear of losing themselves in the process",
-            "Struggling to reconcile their public persona with their true self", 
-            "Torn between their desire for acceptance and their need for independence", 
-            "Grappling with feelings of inadequacy while trying to prove themselves to others",
-            "Struggling to balance their desire for a normal life with the responsibilities that come with their unique abilities or destiny",
-            "Torn between their desire to help others and their need to protect themselves from being taken advantage of or hurt in the process",
-            "Grappling with feelings of loneliness and isolation while trying to connect with others and form meaningful relationships",
-            "Struggling to find a sense of purpose and belonging in a world that isn't accepting of them",
-            "Torn between being honest with themselves and others about their flaws and mistakes, and the fear of being judged or rejected for those imperfections",
-            "Afraid of admitting their own vulnerabilities and weaknesses, leading to a constant internal battle between wanting to be strong and independent, and the need for support and connection with others",
-            "Struggling with accepting their role in society and the expectations that come with it, while also trying to forge their own path and identity outside of those constraints",
-            "Torn between helping others and the fear of being taken advantage of, leading to a constant battle of whether to offer help or prioritize their own safety in a world that requires both compassion and caution"
-        ]
+        Archetype.GUARDIAN: [
+            "To defend a place that holds the memory of everyone they've lost", 
+            "To keep a sacred oath sworn to someone who can no longer hold them to it", 
+            "To protect a secret that would cause war if it were ever revealed", 
+            "To preserve the one safe place left in a world that has gone dark", 
+            "To prevent an ancient evil from being awakened by the careless or the ambitious", 
+            "To ensure that a powerful artifact never falls into the wrong hands", 
+            "To protect the innocent from a threat they don't even know exists", 
+            "To shelter those who have nowhere else to go",
+            "To safeguard a forbidden knowledge that is both dangerous and necessary",
+            "To protect a child whose existence threatens empires",
+            "To guard the truth until the world is wise enough to hear it"
+            ],
 
-        self.hidden_truths = [
-            "They are the heir to a powerful and dangerous legacy that they must keep hidden to protect themselves and those they care about until they have mastered their abilities", 
-            "They have a hidden talent or ability that they have secretly been practicing and perfecting in secret, waiting for the right moment to reveal it to the world", 
-            "They were manipulated into their current situation by someone they trusted, and they are slowly realizing why they were chosen and what their purpose really is", 
-            "They have a secret past that they have been trying to keep hidden, but it is starting to become revealed in uncontrollable ways",
-            "They are connected to a larger conspiracy or plot that they have been involved in for a long time", 
-            "They have a hidden connection to a powerful figure or organization that they are unaware of, and all their actions have been influenced by this connection without them realizing it", 
-            "They are destined for a great and dangerous fate that they have been trying to understand since they were young enough to understand, but they have obstacles they don't yet know how to overcome",
-            "They are the sole survivor of a great and powerful bloodline or lineage that has unimaginable power, but they do not know how to access or control it without first learning the history of their ancestors",
-            "They have the ability to travel between different worlds or dimensions, but they do not understand the affect this has on their home dimension",
-            "They have a secret identity that they have to keep hidden, otherwise they will be targeted and hunted who seek to destroy or use them for their own purposes",
-            "They possess a powerful substance that could be used for great good or great evil, and could cause devastation if it falls into the wrong hands",
-            "They have the knowledge of a powerful secret, but they cannot remember what it is"
+        Archetype.VILLAIN: [
+            "To prove that the system only rewards cruelty, so they became the cruelest", 
+            "To ensure no one ever has power over them again", 
+            "To punish a society that stood by and watched them suffer", 
+            "To claim the throne that was denied to them by birthright", 
+            "To force the world to acknowledge their existence", 
+            "To expose the corruption that hides behind noble faces", 
+            "To achieve the immortality that makes all other concerns irrelevant", 
+            "To become so powerful that betrayal becomes impossible", 
+            "To complete the work of someone who was destroyed for trying", 
+            "To complete the work of someone who was destroyed for trying",
+            "To turn the very people who abandoned them into believers",
+            "To possess the one thing that was always kept out of their reach",
+            "To silence the voice in their head that says they are nothing",
+            "To make the world feel the same helplessness they once felt",
+            "To prove that mercy is an illusion the powerful use to control the weak",
+            "To collapse the divide between what is feared and what is worshipped",
+            "To become the monster the world already decided they were" 
+            ],
+
+        Archetype.OUTCAST: [
+            "To find a place where they are not defined by what made them different", 
+            "To prove that the people who cast them out were wrong about them", 
+            "To build a home in a world that refuses to give them one", 
+            "To find others like them and create a safe haven for those who are deemed unworthy or different by society", 
+            "To turn the thing that made them an outcast into their greatest strength",
+            "To earn acceptance without sacrificing what makes them who they are",
+            "To dismantle the rigid boundaries that decide who belongs and who doesn't",
+            "To make peace with the fact that they may never belong anywhere",
+            "To uncover the conspiracy that led to their banishment",
+            "To find the family they were separated from before they can remember",
+            "To discover the truth behind their exile that no one will tell them",
+            "To answer the question of whether they were cast out or set free"
+        ],
+
+        Archetype.SCHOLAR: [
+            "To decipher an ancient text that holds the key to a forgotten catastrophe", 
+            "To prove a theory that the academic establishment refuses to acknowledge", 
+            "To recover lost knowledge that was deliberately destroyed", 
+            "To complete the unfinished life's work of a mentor who died under mysterious circumstances", 
+            "To catalogue the last remnants of a dying civilization before they vanish",
+            "To unlock the secrets of a power source that could save or destroy everything",
+            "To answer the one question that has haunted them since childhood",
+            "To prevent dangerous knowledge from being weaponized by those who don't understand it",
+            "To solve the puzzle that drove their predecessor to madness",
+            "To untangle the web of misinformation that has corrupted a fundamental truth",
+            "To understand the nature of a curse or affliction that has no known origin",
+            "To decode the language of a species or entity that no one else believes is real"
         ]
+    }
+
+    # Birthplaces
+    birthplaces = [
+        "A bustling city", 
+        "A remote village", 
+        "A noble estate", 
+        "A war-torn region", 
+        "A mystical forest", 
+        "A coastal town", 
+        "A hidden sanctuary", 
+        "A desolate wasteland",
+        "A mountain stronghold", 
+        "A nomadic tribe", 
+        "A secret society", 
+        "A magical academy", 
+        "A forgotten ruin", 
+        "A prosperous kingdom", 
+        "A cursed land", 
+        "A distant planet",
+        "A floating city", 
+        "A subterranean cavern", 
+        "A celestial realm", 
+        "A post-apocalyptic world", 
+        "A parallel dimension"
+    ]
+
+    # Defining moments
+    tragedy_moments = [
+        "Witnessing the death of a loved one", 
+        "Being betrayed by a close friend", 
+        "Suffering a great loss", 
+        "Facing a life-threatening illness", 
+        "Enduring a traumatic event",
+        "Being exiled from their home", 
+        "Losing everything they hold dear", 
+        "Failing to save someone important", 
+        "Being falsely accused of a crime", 
+        "Experiencing a devastating defeat",
+        "Uncovering a dark family secret", 
+        "Being betrayed by a mentor", 
+        "Facing a moral dilemma that leads to tragedy", 
+        "Sacrificing something precious for the greater good", 
+        "Being manipulated into causing harm to others"
+    ]
+
+    triumph_moments = [
+        "Saving someone from danger", 
+        "Overcoming a great obstacle", 
+        "Achieving a lifelong dream", 
+        "Defeating a powerful enemy", 
+        "Uniting warring factions",
+        "Discovering a hidden talent", 
+        "Forming a powerful alliance", 
+        "Outsmarting a formidable opponent", 
+        "Surviving against all odds", 
+        "Redeeming themselves in the eyes of others",
+        "Uncovering a long-lost artifact that changes the course of history", 
+        "Sacrificing their own happiness for the greater good and being celebrated as a hero", 
+        "Outwitting a cunning adversary and emerging victorious against all odds"
+    ]
+
+    revelation_moments = [
+        "Discovering a hidden truth about their past", 
+        "Realizing they were manipulated by someone they trusted", 
+        "Uncovering a conspiracy that changes their worldview", 
+        "Learning a shocking secret about their family", 
+        "Realizing they have a hidden power or destiny",
+        "Discovering that their greatest enemy is actually a close friend or family member", 
+        "Realizing that their core motivation is based on a false premise and having to reevaluate their goals", 
+        "Uncovering a hidden aspect of their identity that challenges everything they thought they knew about themselves"
+    ]
+
+    # Key relationships
+    relationships = [
+        {
+            "role": "Childhood Friend",
+            "descriptions": [
+                "Who has been by their side through the best and worst of times",
+                "Who knows all their secrets",
+                "Who has always believed in them even when no one else did",
+                "Who they lost touch with after a small argument that turned into a long-standing rift",
+                "Who they reconnected with after years of separation and found that they had changed in ways they never expected",
+                "Who they had a falling out with over a miscommunication where neither were capable of admitting they were wrong and it led to a permanent estrangement",
+                "Who helped them get through their darkest moments",
+                "Who they were never super close with, but always had a friendly relationship with and they always looked out for each other in small ways",
+                "Who they had a brief romantic relationship with that ended amicably but they still care for each other deeply",
+                "Who they had a brief romantic relationship with that ended badly and they haven't spoken since",
+            ]
+        },
+
+        {
+            "role": "Mentor",
+            "descriptions": [
+                "Who taught them everything they know and shaped who they are today",
+                "Who they looked up to and wanted to be like, but they tragically lost them and they have never been able to replace that influence in their life",
+                "Who made them feel capable of more than just surviving and inspired them to pursue something greater than what has been expected of them",
+                "Who they trusted wholeheartedly, but chose to part ways after a major disagreement that they could never resolve or communicate about effectively",
+                "Who they viewed as a parental figure and has continued to stay by their side as a source of comfort, support, and guidance throughout their life",
+                "Who forced them to confront their deepest fears in order to become stronger, and able to withstand the challenges they would undeniably face in the future",
+                "Who committed their life to ensuring their survival and success, even at great personal cost",
+                "Who encouraged them to embrace their abilities and potential, unintentionally leading them down a path that has caused them great pain and suffering"
+            ]
+        },
+
+        {
+            "role": "Partner in Crime",
+            "descriptions": [
+                "Who they met on a random adventure and they just clicked, becoming inseparable partners in crime and mischief",
+                "Who they met in a moment of chaos and they found peace in each other's company, forming a bond that has lasted through vast distances and long periods of separation",
+                "Who they share a similar outlook on life with, finding comfort in someone who is so similar",
+                "Who they would give their life for, but they have a complicated relationship with because they are so similar",
+                "Who they can fully trust with their life, but can never fully open up emotionally to",
+                "Who they share a similar past with, but they have a complicated realationship because of how they eventually grew up in different directions and situations",
+                "Who they didn't trust at first, until they were in a situation where they had to rely on each other completely",
+                "Who they met through a mutual friend, and quickly formed a deep understanding over the tragic events they have both experienced in their lives"
+            ]    
+        },
+
+        {
+            "role": "Rival",
+            "descriptions": [
+                "Who indirectly pushes them to be better by being a constant source of competition and comparison",
+                "Who wants everything they have and will stop at nothing to get it, making them a constant low-level threat and bothersome presence in their life",
+                "Who was once a close friend, but jealousy and misunderstandings drove them apart and they have been bitter rivals ever since",
+                "Who they used to look up to, but they have become brainwashed by a toxic ideology and is no longer capable of recognizing right from wrong",
+                "Who they used to look up to, but they have become corrupted by power and greed",
+                "Who they used to view as family, but they betrayed them in an unforgivable manner, and nothing can repair the damage",
+                "Who seeks to destroy them and everything they care about, but underneath it all they hold a small fragment of admiration from the past"
+            ]    
+        },
+
+        {
+            "role": "Love Interest",
+            "descriptions": [
+                "Who they met on a random adventure, and became inseparable partners in love and life, sharing an unbreakable bond that will last generations",
+                "Who they will lay down their life for without a second thought",
+                "Who makes their heart feel full, alive, and protected, in spite of the harsh and cruel world surrounding them",
+                "Who uplifts their dreams and ambitions, encouraging them to be the best version of themselves while still accepting their flaws and imperfections",
+                "Who reminds them that they are more than just the expectations and burdens they carry",
+                "Who walks beside them through the darkest, toughest times, and makes them feel like they are capable of even the most impossible feats as long as they have each other",
+                "Who always knows how to make them smile even after a long day, providing laughter and comfort in a dark world"
+            ] 
+        },
+
+        {
+            "role": "Mysterious Stranger",
+            "descriptions": [
+                "Who appears in random moments of their life, offering cryptic, but valuable, advice that they don't understand until when they need it most",
+                "Who they met in a moment of unexpected kindness, and they have been trying to repay the kindness offered ever since",
+                "Who offers pieces of information about the future in exchange for small favors",
+                "Who offers pieces of information about the past in exchange for small favors",
+                "Who offers pieces of information about the present in exchange for small favors",
+                "Who seems to know more about them than they know about themselves",
+                "Who randomly appears in their life at moments of great need, offering tokens of help for a secret"
+            ]    
+        },
+    ]
+
+    distinctive_features = [
+        "A prominent scar across their face", 
+        "A unique birthmark in the shape of a star", 
+        "Freckles that form a recognizable constellation",
+        "Piercing colored eyes that shine in the dark", 
+        "A distinctive tattoo that holds personal significance",
+        "An unusual hairstyle that sets them apart",
+        "A prosthetic limb that they have adapted to use with great skill", 
+        "A distinctive way of dressing that makes them easily identifiable", 
+        "A unique accent or way of speaking that is different from those around them",
+        "A physical deformity that they have learned to embrace as part of their identity", 
+        "A signature piece of jewelry that they always wear", 
+        "A distinctive laugh that is instantly recognizable", 
+        "A unique mannerism that others find endearing or unsettling",
+        "A unique hairstyle that only they can pull off",
+        "Colored hair that is not common in their world",
+        "No eyebrows or eyelashes",
+        "A voice that is unusually deep or high-pitched",
+        "An extra finger that they have learned to use with surprising dexterity",
+    ]
+
+    fatal_flaws = [
+        "Pride that blinds them to their own weaknesses", 
+        "A quick temper that leads to rash decisions", 
+        "A tendency to trust the wrong people", 
+        "An obsession with revenge that consumes them", 
+        "A fear of abandonment that causes them to push others away",
+        "A need for control that leads to micromanaging and alienating allies", 
+        "A tendency to take unnecessary risks in pursuit of their goals", 
+        "A deep-seated insecurity that undermines their confidence", 
+        "A stubborn refusal to change their ways even when it's clear they are wrong",
+        "A tendency to overthink and second-guess themselves to the point of inaction",
+        "A fear of failure that prevents them from taking necessary risks or pursuing their true potential",
+        "A tendency to forgive too easily, allowing others to take advantage of their kindness and generosity",
+        "A fear of intimacy that prevents them from forming close relationships",
+        "A tendency to overcomplicate things, making simple problems more difficult than they need to be",
+        "An obsession with needing to be wanted or needed by others, leading them to make sacrifices that ultimately harm themselves or those they care about",
+        "A tendency to overthink and analyze every situation from a negative perspective, leading to believing the worst about themselves and others, even when there is evidence to the contrary",
+        "A stubbornness that prevents them from admitting when they are wrong or accepting help from others, even when it would be in their best interest to do so",
+        "A tendency to get aggressive or defensive when they feel threatened, leading to escalating conflicts that could have been avoided with better communication or emotional regulation",
+        "A fear of being with someone that doesn't love them back, leading to unhealthy attachments or sabotaging potential relationships out of fear of rejection"
+    ]
+
+    greatest_fears = [
+        "Being abandoned by those they care about with no explanation or warning", 
+        "Feeling excruciating loneliness even when surrounded by others", 
+        "Failure after putting everything and everyone on the line to achieve a goal they believed in", 
+        "Betrayal by someone that had been with them from the beginning and had been trusted implicitly", 
+        "Death to someone that didn't deserve it",
+        "Losing their sense of identity from a toxic relationship or environment", 
+        "Being powerless to protect those they care about", 
+        "Being powerful but unable to control their abilities or influence, causing unintended harm to others", 
+        "Being powerful, but powerless in the face of overwhelming odds or threats, causing devastation despite their best efforts",
+        "Facing the consequences of their actions that they believed were justified", 
+        "Being forgotten or erased from history despite their significant contributions and sacrifices",
+        "Never living up to their potential despite their best efforts",
+        "Never living up to the expectations they set for themselves",
+        "Facing the inevitability of their own humanity and mortality",
+        "Having to make a choice between two equally difficult paths",
+        "Having to make a choice between saving someone they love and achieving a goal that could save many others",
+    ]
+
+    internal_conflicts = [
+        "Struggling between their desire for revenge and their need for redemption", 
+        "Torn between their loyalty to their family and their personal ambitions", 
+        "Grappling with feelings of guilt over past mistakes while trying to move forward", 
+        "Torn between their desire for power and their fear of losing themselves in the process",
+        "Struggling to reconcile their public persona with their true self", 
+        "Torn between their desire for acceptance and their need for independence", 
+        "Grappling with feelings of inadequacy while trying to prove themselves to others",
+        "Struggling to balance their desire for a normal life with the responsibilities that come with their unique abilities or destiny",
+        "Torn between their desire to help others and their need to protect themselves from being taken advantage of or hurt in the process",
+        "Grappling with feelings of loneliness and isolation while trying to connect with others and form meaningful relationships",
+        "Struggling to find a sense of purpose and belonging in a world that isn't accepting of them",
+        "Torn between being honest with themselves and others about their flaws and mistakes, and the fear of being judged or rejected for those imperfections",
+        "Afraid of admitting their own vulnerabilities and weaknesses, leading to a constant internal battle between wanting to be strong and independent, and the need for support and connection with others",
+        "Struggling with accepting their role in society and the expectations that come with it, while also trying to forge their own path and identity outside of those constraints",
+        "Torn between helping others and the fear of being taken advantage of, leading to a constant battle of whether to offer help or prioritize their own safety in a world that requires both compassion and caution"
+    ]
+
+    hidden_truths = [
+        "They are the heir to a powerful and dangerous legacy that they must keep hidden to protect themselves and those they care about until they have mastered their abilities", 
+        "They have a hidden talent or ability that they have secretly been practicing and perfecting in secret, waiting for the right moment to reveal it to the world", 
+        "They were manipulated into their current situation by someone they trusted, and they are slowly realizing why they were chosen and what their purpose really is", 
+        "They have a secret past that they have been trying to keep hidden, but it is starting to become revealed in uncontrollable ways",
+        "They are connected to a larger conspiracy or plot that they have been involved in for a long time", 
+        "They have a hidden connection to a powerful figure or organization that they are unaware of, and all their actions have been influenced by this connection without them realizing it", 
+        "They are destined for a great and dangerous fate that they have been trying to understand since they were young enough to understand, but they have obstacles they don't yet know how to overcome",
+        "They are the sole survivor of a great and powerful bloodline or lineage that has unimaginable power, but they do not know how to access or control it without first learning the history of their ancestors",
+        "They have the ability to travel between different worlds or dimensions, but they do not understand the affect this has on their home dimension",
+        "They have a secret identity that they have to keep hidden, otherwise they will be targeted and hunted who seek to destroy or use them for their own purposes",
+        "They possess a powerful substance that could be used for great good or great evil, and could cause devastation if it falls into the wrong hands",
+        "They have the knowledge of a powerful secret, but they cannot remember what it is"
+    ]
+
+    return {
+        "names": names,
+        "personality_positive": personality_positive,
+        "personality_negative": personality_negative,
+        "personality_neutral": personality_neutral,
+        "motivations": motivations,
+        "birthplaces": birthplaces,
+        "tragedy_moments": tragedy_moments,
+        "triumph_moments": triumph_moments,
+        "revelation_moments": revelation_moments,
+        "relationships": relationships,
+        "distinctive_features": distinctive_features,
+        "fatal_flaws": fatal_flaws,
+        "greatest_fears": greatest_fears,
+        "internal_conflicts": internal_conflicts,
+        "hidden_truths": hidden_truths,
+    }
+
+register_corpus(DEFAULT_CORPUS, _fantasy_sections)
+
+def _roster_rng(seed: int, index: int) -> random.Random:
+    """Random Source for One Position in a Seeded Roster"""
+    return random.Random(f"{seed}:{index}")
+
+# Unseeded generators, given fresh random sources in every forked child
+_unseeded: 'weakref.WeakSet[LoreGenerator]' = weakref.WeakSet()
+
+def _reseed_after_fork() -> None:
+    """Give Each Unseeded Generator New Entropy in a Forked Child"""
+    for generator in list(_unseeded):
+        generator._init_rng()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child = _reseed_after_fork)
 
-    def generate(self, archetype: Optional[Archetype] = None,
-                origin: Optional[Origin] = None,
-                name: Optional[str] = None) -> CharacterLore:
-        """Generate Character Lore
-        
-        Args:
-            Archetype: Character Archetype (random if None)
-            Origin: Character Origin (random if None)
-            Name: Character Name (random if None)
+class LoreGenerator:
+    """Main Character Lore Generator
+
+    Each thread that calls generate() without an rng gets its own random
+    source, seeded from the generator's seed, so threads never share or
+    contend on random state. The corpus is only read during generation.
+
+    An unseeded generator draws fresh entropy again in every forked child
+    and every unpickled copy, so processes never repeat each other. A
+    seeded generator restarts the same stream in every process it reaches;
+    to split seeded work across processes, give each one its own positions
+    with generate_at(seed, index) instead.
+    """
+
+    def __init__(self, params: Optional[LoreParameters] = None,
+                 seed: Optional[int] = None,
+                 corpus: str = DEFAULT_CORPUS):
+        self.params = params or LoreParameters.default()
+        self.seed = seed
+        self.corpus_name = corpus
+        self._corpus = get_corpus(corpus)
+        self._init_rng()
+
+    def _init_rng(self):
+        """Set Up the Per-Thread Random Sources"""
+        self._seeds = random.Random(self.seed)
+        self._seeds_lock = threading.Lock()
+        self._local = threading.local()
+        if self.seed is None:
+            _unseeded.add(self)
+
+    @property
+    def rng(self) -> random.Random:
+        """Random Source Owned by the Calling Thread"""
+        rng = getattr(self._local, "rng", None)
+        if rng is None:
+            with self._seeds_lock:
+                rng = random.Random(self._seeds.getrandbits(64))
+            self._local.rng = rng
+        return rng
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ("_seeds", "_seeds_lock", "_local"):
+            del state[key]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_rng()
+
+    @property
+    def corpus(self) -> Corpus:
+        """Current Corpus, Including Any Reload Since the Generator Was Made"""
+        return _corpora.get(self.corpus_name, self._corpus)
+
+    @property
+    def corpus_version(self) -> str:
+        """Content Hash of the Corpus This Generator Draws From"""
+        return self.corpus.version
+
+    def with_params(self, params: LoreParameters) -> 'LoreGenerator':
+        """Copy of This Generator Using Other Parameters, Sharing the Corpus"""
+        generator = copy.copy(self)
+        generator.params = params
+        return generator
+
+    def generate_at(self, seed: int, index: int) -> CharacterLore:
+        """Generate the Character at a Position in a Seeded Roster
+
+        The same seed, index and parameters always give the same character,
+        without generating any of the characters before it.
+        """
+        return self.generate(rng = _roster_rng(seed, index))
 
-        Returns:
-            Character Lore with Complete Backstory
+    def identity_at(self, seed: int, index: int) -> Tuple[Archetype, Origin, str]:
+        """Archetype, Origin and Name of the Character at a Seeded Position
+
+        Matches generate_at() but stops after the first three draws.
         """
+        return self._draw_identity(self.corpus, _roster_rng(seed, index))
 
-        archetype = archetype or random.choice(list(Archetype))
-        origin = origin or random.choice(list(Origin))
+    def _draw_identity(self, corpus: Corpus, rng,
+                       archetype: Optional[Archetype] = None,
+                       origin: Optional[Origin] = None,
+                       name: Optional[str] = None) -> Tuple[Archetype, Origin, str]:
+        """Draw Whichever of Archetype, Origin and Name Were Not Given"""
+        archetype = archetype or rng.choice(ARCHETYPES)
+        origin = origin or rng.choice(ORIGINS)
 
         if not name:
-            name = random.choice(self.names[origin])
-
-        age_ranges = {
-            Archetype.HERO: (16, 25),
-            Archetype.ANTIHERO: (25, 40),
-            Archetype.MENTOR: (60, 85),
-            Archetype.TRICKSTER: (14, 30),
-            Archetype.GUARDIAN: (35, 60),
-            Archetype.VILLAIN: (25, 60),
-            Archetype.OUTCAST: (18, 40),
-            Archetype.SCHOLAR: (24, 70)
-        }
-        min_age, max_age = age_ranges[archetype]
-        age = random.randint(min_age, max_age)
+            name = rng.choice(corpus.names[origin])
+        return archetype, origin, name
 
+    def _sample_traits(self, corpus: Corpus, rng) -> List[str]:
+        """Draw Three or Four Personality Traits"""
         traits = []
-        traits.append(random.choice(self.personality_positive))
-        traits.append(random.choice(self.personality_negative))
-        traits.append(random.choice(self.personality_neutral))
-        if random.random() > 0.5:
-            traits.append(random.choice(self.personality_positive + self.personality_neutral))
-
-        core_motivation = random.choice(self.motivations[archetype])
-        fatal_flaw = random.choice(self.fatal_flaws)
-        greatest_fear = random.choice(self.greatest_fears)
-        internal_conflict = random.choice(self.internal_conflicts)
-        hidden_truth = random.choice(self.hidden_truths) if random.random() < self.params.mystery_factor else None
-
-        birthplace = random.choice(self.birthplaces)
-
+        traits.append(rng.choice(corpus.personality_positive))
+        traits.append(rng.choice(corpus.personality_negative))
+        traits.append(rng.choice(corpus.personality_neutral))
+        if rng.random() > 0.5:
+            traits.append(rng.choice(corpus.extra_traits))
+        return traits
+
+    def _sample_hidden_truth(self, corpus: Corpus, rng) -> Optional[str]:
+        """Draw a Hidden Truth with Probability mystery_factor"""
+        return rng.choice(corpus.hidden_truths) if rng.random() < self.params.mystery_factor else None
+
+    def _sample_moments(self, corpus: Corpus, rng) -> List[str]:
+        """Draw complexity_weight Distinct Defining Moments"""
         defining_moments = []
         num_moments = self.params.complexity_weight
         seen_moments = set()
@@ -960,10 +1527,10 @@ class LoreGenerator:
         max_attempts = max(10, num_moments * 10)
 
         while len(defining_moments) < num_moments and attempts < max_attempts:
-            if random.random() < self.params.tragedy_weight:
-                moment = random.choice(self.tragedy_moments)
+            if rng.random() < self.params.tragedy_weight:
+                moment = rng.choice(corpus.tragedy_moments)
             else:
-                moment = random.choice(self.revelation_moments)
+                moment = rng.choice(corpus.revelation_moments)
             if moment not in seen_moments:
                 seen_moments.add(moment)
                 defining_moments.append(moment)
@@ -971,7 +1538,7 @@ class LoreGenerator:
 
         if len(defining_moments) < num_moments:
             remaining = [
-                moment for moment in (self.tragedy_moments + self.revelation_moments)
+                moment for moment in (corpus.tragedy_moments + corpus.revelation_moments)
                 if moment not in seen_moments
             ]
             for moment in remaining:
@@ -979,29 +1546,120 @@ class LoreGenerator:
                     break
                 seen_moments.add(moment)
                 defining_moments.append(moment)
-        
+        return defining_moments
+
+    def _sample_relationships(self, corpus: Corpus, rng) -> List[Dict[str, str]]:
+        """Draw relationship_weight Relationships with Distinct Roles"""
         key_relationships = []
         num_relationships = self.params.relationship_weight
         used_roles = set()
-        
 
         for _ in range(num_relationships):
-            available = [r for r in self.relationships if r["role"] not in used_roles]
+            available = [r for r in corpus.relationships if r["role"] not in used_roles]
             if not available:
                 break
-            rel = random.choice(available)
+            rel = rng.choice(available)
             used_roles.add(rel["role"])
-            rel_name = random.choice(self.names[random.choice(list(Origin))])
+            rel_name = rng.choice(corpus.names[rng.choice(ORIGINS)])
 
             key_relationships.append({
                 "name": rel_name,
                 "role": rel["role"],
-                "description": random.choice(rel["descriptions"])
-            }) 
+                "description": rng.choice(rel["descriptions"])
+            })
+        return key_relationships
+
+    def reroll(self, lore: CharacterLore, fields: Iterable[str],
+               rng: Optional[random.Random] = None) -> CharacterLore:
+        """Resample Only Some Fields of a Character
+
+        Archetype and origin are kept, and rerolled fields are drawn under
+        this generator's parameters as in generate(). Rendered sections
+        cached by cached_narrative() carry over for every section whose
+        fields did not change (none do if the corpus has placeholders and a
+        field they can refer to changed).
+
+        Args:
+            lore: Character to Start From (left unchanged)
+            fields: Field Names to Resample, e.g. ["fatal_flaw", "key_relationships"]
+            rng: Random Source to Draw From (the calling thread's if None)
+
+        Returns:
+            New Character Lore
+        """
+        rng = rng or self.rng
+        corpus = self.corpus
+        samplers = {
+            "name": lambda: rng.choice(corpus.names[lore.origin]),
+            "age": lambda: rng.randint(*AGE_RANGES[lore.archetype]),
+            "personality_traits": lambda: self._sample_traits(corpus, rng),
+            "distinctive_features": lambda: rng.choice(corpus.distinctive_features),
+            "birthplace": lambda: rng.choice(corpus.birthplaces),
+            "defining_moments": lambda: self._sample_moments(corpus, rng),
+            "core_motivation": lambda: rng.choice(corpus.motivations[lore.archetype]),
+            "fatal_flaw": lambda: rng.choice(corpus.fatal_flaws),
+            "greatest_fear": lambda: rng.choice(corpus.greatest_fears),
+            "internal_conflict": lambda: rng.choice(corpus.internal_conflicts),
+            "hidden_truth": lambda: self._sample_hidden_truth(corpus, rng),
+            "key_relationships": lambda: self._sample_relationships(corpus, rng),
+        }
+
+        fields = list(fields)
+        unknown = [name for name in fields if name not in samplers]
+        if unknown:
+            raise ValueError(f"Cannot reroll: {', '.join(unknown)}")
+
+        rerolled = replace(lore, **{name: samplers[name]() for name in fields})
+        rerolled._has_placeholders = lore._has_placeholders or corpus.placeholders
+        if lore._rendered is not None:
+            stale = {FIELD_SECTIONS[name] for name in fields}
+            if rerolled._has_placeholders and any(name in PLACEHOLDER_FIELDS for name in fields):
+                # Placeholders may repeat these fields in any section
+                stale = set(_SECTION_RENDERERS)
+            rerolled._rendered = {
+                section: text for section, text in lore._rendered.items() if section not in stale
+            }
+        return rerolled
+
+    def generate(self, archetype: Optional[Archetype] = None,
+                origin: Optional[Origin] = None,
+                name: Optional[str] = None,
+                rng: Optional[random.Random] = None) -> CharacterLore:
+        """Generate Character Lore
+        
+        Args:
+            Archetype: Character Archetype (random if None)
+            Origin: Character Origin (random if None)
+            Name: Character Name (random if None)
+            rng: Random Source to Draw From (the calling thread's if None)
+
+        Returns:
+            Character Lore with Complete Backstory
+        """
+        rng = rng or self.rng
+        corpus = self.corpus
+
+        archetype, origin, name = self._draw_identity(corpus, rng, archetype, origin, name)
+
+        min_age, max_age = AGE_RANGES[archetype]
+        age = rng.randint(min_age, max_age)
+
+        traits = self._sample_traits(corpus, rng)
+
+        core_motivation = rng.choice(corpus.motivations[archetype])
+        fatal_flaw = rng.choice(corpus.fatal_flaws)
+        greatest_fear = rng.choice(corpus.greatest_fears)
+        internal_conflict = rng.choice(corpus.internal_conflicts)
+        hidden_truth = self._sample_hidden_truth(corpus, rng)
+
+        birthplace = rng.choice(corpus.birthplaces)
+
+        defining_moments = self._sample_moments(corpus, rng)
+        key_relationships = self._sample_relationships(corpus, rng)
 
-        distinctive_features = random.choice(self.distinctive_features)
+        distinctive_features = rng.choice(corpus.distinctive_features)
 
-        return CharacterLore(
+        lore = CharacterLore(
             name = name,
             age = age,
             archetype = archetype,
@@ -1017,6 +1675,8 @@ class LoreGenerator:
             hidden_truth = hidden_truth,
             key_relationships = key_relationships
         )
+        lore._has_placeholders = corpus.placeholders
+        return lore
 
 def main():
     """Demo Showing Lore Generation"""
@@ -1029,21 +1689,21 @@ def main():
 
     print("\n1. Tragic Hero:\n")
     params1 = LoreParameters.tragic_hero()
-    character1 = generator.generate(archetype=Archetype.HERO, origin=Origin.NOBLE)
+    character1 = generator.with_params(params1).generate(archetype=Archetype.HERO, origin=Origin.NOBLE)
     print(character1.to_narrative())
 
     print("\n" + "="*40 + "\n")
 
     print("\n2. Mysterious Stranger:\n")
     params2 = LoreParameters.mysterious_stranger()
-    character2 = generator.generate(archetype=Archetype.TRICKSTER, origin=Origin.EXILE)
+    character2 = generator.with_params(params2).generate(archetype=Archetype.TRICKSTER, origin=Origin.EXILE)
     print(character2.to_narrative())
 
     print("\n" + "="*40 + "\n")
 
     print("\n3. Epic Villain:\n")
     params3 = LoreParameters.epic_villain()
-    character3 = generator.generate(archetype=Archetype.VILLAIN, origin=Origin.ACADEMIC)
+    character3 = generator.with_params(params3).generate(archetype=Archetype.VILLAIN, origin=Origin.ACADEMIC)
     print(character3.to_narrative())
 
 if __name__ == "__main__":
@@ -0,0 +1,130 @@
+"""
+Preforked Worker Pool Sharing One Loaded Corpus
+"""
+
+import gc
+import multiprocessing
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from lore_generator import LoreGenerator, LoreParameters, CharacterLore, DEFAULT_CORPUS
+
+# Set in each worker from its own pool's initargs
+_generator: Optional[LoreGenerator] = None
+
+# Open pools relying on the frozen heap; the last one to close unfreezes it
+_frozen_pools = 0
+
+def _init_worker(generator: LoreGenerator) -> None:
+    global _generator
+    _generator = generator
+    # Fresh random sources, so generate() without an rng differs per worker
+    generator._init_rng()
+    # The parent froze everything it loaded; collect only what workers create
+    gc.enable()
+
+def _generate(task) -> CharacterLore:
+    seed, index = task
+    return _generator.generate_at(seed, index)
+
+def _narrative(task) -> str:
+    seed, index = task
+    return _generator.generate_at(seed, index).to_narrative()
+
+def _call(task):
+    func, item = task
+    return func(_generator, item)
+
+class PreforkPool:
+    """Process Pool Whose Workers Are Forked from a Parent Holding the Corpus
+
+    The parent builds the generator once, moves everything it has loaded
+    into the permanent GC generation with gc.freeze(), and then forks the
+    workers. Workers start without importing or building anything, and
+    the collector never walks (and so never writes to) the shared corpus
+    pages, which keeps them shared copy-on-write. The generator reaches
+    the workers as their initializer's argument, which fork hands over
+    without pickling, so workers re-forked by maxtasksperchild keep their
+    own pool's generator however many pools are open. Each worker,
+    including each re-forked one, reseeds the generator from fresh
+    entropy, so generate() without an rng gives every worker its own
+    stream; seeded work goes through generate_at and is unaffected.
+
+    Everything the parent held when the first open pool froze the heap
+    stays uncollectable until the last open pool is closed or terminated,
+    which unfreezes it.
+
+    Requires the "fork" start method (Linux and other Unix systems).
+    """
+
+    def __init__(self, processes: Optional[int] = None,
+                 params: Optional[LoreParameters] = None,
+                 corpus: str = DEFAULT_CORPUS,
+                 maxtasksperchild: Optional[int] = None):
+        global _frozen_pools
+        try:
+            context = multiprocessing.get_context("fork")
+        except ValueError:
+            raise RuntimeError("PreforkPool needs the fork start method, which this platform lacks") from None
+
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.generator = LoreGenerator(params, corpus = corpus)
+            gc.collect()
+            gc.freeze()
+            _frozen_pools += 1
+            self._frozen = True
+            self._pool = context.Pool(processes, initializer = _init_worker,
+                                      initargs = (self.generator,),
+                                      maxtasksperchild = maxtasksperchild)
+        except BaseException:
+            self._unfreeze()
+            raise
+        finally:
+            if enabled:
+                gc.enable()
+
+    def generate(self, seed: int, indices: Iterable[int], chunksize: int = 64) -> List[CharacterLore]:
+        """Characters at Seeded Positions, in Order"""
+        return self._pool.map(_generate, [(seed, index) for index in indices], chunksize)
+
+    def narratives(self, seed: int, indices: Iterable[int], chunksize: int = 64) -> Iterator[str]:
+        """Rendered Characters at Seeded Positions, Streamed in Order"""
+        return self._pool.imap(_narrative, ((seed, index) for index in indices), chunksize)
+
+    def map(self, func: Callable, items: Iterable, chunksize: int = 1) -> list:
+        """Run func(generator, item) in the Workers for Each Item
+
+        func must be a module-level function so it can be sent to workers.
+        """
+        return self._pool.map(_call, [(func, item) for item in items], chunksize)
+
+    def close(self) -> None:
+        """Stop Accepting Work and Wait for the Workers to Finish"""
+        self._pool.close()
+        self._pool.join()
+        self._unfreeze()
+
+    def terminate(self) -> None:
+        """Stop the Workers Immediately"""
+        self._pool.terminate()
+        self._pool.join()
+        self._unfreeze()
+
+    def _unfreeze(self) -> None:
+        """Release This Pool's Hold on the Frozen Heap"""
+        global _frozen_pools
+        if getattr(self, "_frozen", False):
+            self._frozen = False
+            _frozen_pools -= 1
+            if _frozen_pools == 0:
+                gc.unfreeze()
+
+    def __enter__(self) -> 'PreforkPool':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
@@ -0,0 +1,110 @@
+"""
+Hot Reloading of Corpus Files
+"""
+
+import logging
+import os
+import threading
+from typing import Callable, Dict, Optional
+
+from lore_generator import Corpus, SECTIONS, corpus_paths, reload_corpus
+
+logger = logging.getLogger(__name__)
+
+class CorpusWatcher:
+    """Polls a Corpus's Source Files and Reloads It When They Change
+
+    Reloads happen through reload_corpus(), which builds the new corpus off
+    to the side and swaps it in whole, so generators pick it up on their
+    next generate() call without a restart. A file saved mid-edit that
+    does not parse, or leaves a section empty or malformed, fails the
+    reload, and the old corpus stays in use until the file is fixed.
+    """
+
+    def __init__(self, name: str, interval: float = 1.0,
+                 on_reload: Optional[Callable[[Corpus], None]] = None,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """Watch a Registered Corpus
+
+        Args:
+            name: Corpus Registered with register_corpus_file or register_corpus_dir
+            interval: Seconds Between Polls When Running in the Background
+            on_reload: Called with the New Corpus After Each Reload
+            on_error: Called When a Reload Fails (the old corpus stays in use);
+                if None, check() raises and the background thread logs the error
+        """
+        self.name = name
+        self.interval = interval
+        self.on_reload = on_reload
+        self.on_error = on_error
+        self._paths = corpus_paths(name)
+        if not self._paths:
+            raise ValueError(f"Corpus {name!r} was not registered from files")
+        self._mtimes = self._scan()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _scan(self) -> Dict[str, int]:
+        """Modification Time of Every Source File"""
+        mtimes = {}
+        for path in self._paths:
+            files = [path]
+            if os.path.isdir(path):
+                files = [os.path.join(path, section + ".json") for section in SECTIONS]
+            for file in files:
+                try:
+                    mtimes[file] = os.stat(file).st_mtime_ns
+                except FileNotFoundError:
+                    pass
+        return mtimes
+
+    def check(self) -> Optional[Corpus]:
+        """Reload the Corpus if Any Source File Changed
+
+        Returns:
+            The New Corpus, or None if Nothing Changed
+        """
+        mtimes = self._scan()
+        if mtimes == self._mtimes:
+            return None
+        try:
+            corpus = reload_corpus(self.name)
+        except Exception as e:
+            # Files may be mid-edit; try again on the next change
+            self._mtimes = mtimes
+            if self.on_error is None:
+                raise
+            self.on_error(e)
+            return None
+        self._mtimes = mtimes
+        if self.on_reload is not None:
+            self.on_reload(corpus)
+        return corpus
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Reloading corpus %r failed; keeping the previous version", self.name)
+
+    def start(self) -> 'CorpusWatcher':
+        """Poll in a Background Thread"""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target = self._run, name = f"corpus-watcher-{self.name}", daemon = True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the Background Thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'CorpusWatcher':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
@@ -0,0 +1,262 @@
+"""
+Sharded Generation of One Roster Across Machines
+
+A job is a seed, parameters and a total count. Each shard generates one
+contiguous range of positions with LoreGenerator.generate_at, so shards
+can run anywhere in any order, and merging them gives the same file as
+generating the whole roster on one machine.
+
+    python lore_shard.py run --seed 42 --total 1000000 --shards 8 --shard 3 --out shards/
+    python lore_shard.py merge --out all_characters.md shards/
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+from dataclasses import dataclass, asdict
+from typing import Iterable, List, Optional
+
+from lore_generator import LoreGenerator, LoreParameters, DEFAULT_CORPUS
+from lore_export import HEADER, CHARACTER_HEADING, SEPARATOR, open_output
+
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = ".manifest.json"
+
+# Bytes per read when hashing and copying shard files
+COPY_BUFFER = 1024 * 1024
+
+@dataclass
+class ShardManifest:
+    """What One Shard Covers and How to Check Its Output"""
+    seed: int
+    params: dict
+    corpus: str
+    corpus_version: str
+    total: int
+    shards: int
+    shard: int
+    start: int
+    stop: int
+    path: str
+    size: int
+    sha256: str
+    version: int = MANIFEST_VERSION
+
+    @classmethod
+    def load(cls, path: str) -> 'ShardManifest':
+        """Load a Manifest from JSON File"""
+        with open(path, "r", encoding = "utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"{path}: unsupported manifest version {data.get('version')}")
+        return cls(**data)
+
+    def save(self, path: str) -> None:
+        """Write the Manifest as JSON"""
+        with open(path, "w", encoding = "utf-8") as f:
+            json.dump(asdict(self), f, indent = 2)
+
+    def job(self) -> tuple:
+        """Fields Every Shard of the Same Job Agrees On"""
+        return (self.seed, sorted(self.params.items()), self.corpus,
+                self.corpus_version, self.total, self.shards)
+
+def plan_shards(total: int, shards: int) -> List[range]:
+    """Split Positions 0..total into Contiguous Ranges of Near-Equal Size"""
+    if total < 0:
+        raise ValueError("Total must not be negative")
+    if shards < 1:
+        raise ValueError("Shard count must be at least 1")
+    size, extra = divmod(total, shards)
+    ranges = []
+    start = 0
+    for shard in range(shards):
+        stop = start + size + (1 if shard < extra else 0)
+        ranges.append(range(start, stop))
+        start = stop
+    return ranges
+
+def shard_name(shard: int, shards: int) -> str:
+    """File Name of One Shard's Output"""
+    return f"shard-{shard:05d}-of-{shards:05d}.md"
+
+def run_shard(seed: int, total: int, shards: int, shard: int, directory: str,
+              params: Optional[LoreParameters] = None,
+              corpus: str = DEFAULT_CORPUS) -> ShardManifest:
+    """Generate One Shard and Write Its Output and Manifest
+
+    The output holds only the character blocks, numbered by their place
+    in the whole roster; merge() adds the header. The manifest is written
+    last, so a shard without one did not finish.
+
+    Args:
+        seed: Roster Seed
+        total: Characters in the Whole Job
+        shards: Number of Shards in the Job
+        shard: This Shard (0-based)
+        directory: Where to Write the Output and Manifest
+        params: Generation Parameters (defaults if None)
+        corpus: Registered Corpus Name, Which Must Be the Same on Every Machine
+
+    Returns:
+        The Written Manifest
+    """
+    if not 0 <= shard < shards:
+        raise ValueError(f"Shard must be in 0..{shards - 1}")
+    generator = LoreGenerator(params, corpus = corpus)
+    positions = plan_shards(total, shards)[shard]
+
+    os.makedirs(directory, exist_ok = True)
+    name = shard_name(shard, shards)
+    path = os.path.join(directory, name)
+    digest = hashlib.sha256()
+    size = 0
+    with open(path + ".part", "wb") as f:
+        for index in positions:
+            narrative = generator.generate_at(seed, index).to_narrative()
+            block = (CHARACTER_HEADING.format(number = index + 1) + narrative + SEPARATOR).encode("utf-8")
+            f.write(block)
+            digest.update(block)
+            size += len(block)
+    os.replace(path + ".part", path)
+
+    manifest = ShardManifest(
+        seed = seed,
+        params = asdict(generator.params),
+        corpus = corpus,
+        corpus_version = generator.corpus_version,
+        total = total,
+        shards = shards,
+        shard = shard,
+        start = positions.start,
+        stop = positions.stop,
+        path = name,
+        size = size,
+        sha256 = digest.hexdigest(),
+    )
+    manifest.save(path + MANIFEST_SUFFIX)
+    return manifest
+
+def find_manifests(paths: Iterable[str]) -> List[str]:
+    """Manifest Files Given Directly or Found in the Given Directories"""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found.extend(sorted(glob.glob(os.path.join(path, "*" + MANIFEST_SUFFIX))))
+        else:
+            found.append(path)
+    return found
+
+def validate(manifests: List[ShardManifest]) -> List[ShardManifest]:
+    """Check That Manifests Form One Complete Job, Returning Them in Order
+
+    Raises ValueError if the shards come from different jobs or corpus
+    versions, if any shard is missing or repeated, or if the ranges do
+    not tile the whole roster.
+    """
+    if not manifests:
+        raise ValueError("No shard manifests given")
+    job = manifests[0].job()
+    for manifest in manifests:
+        if manifest.job() != job:
+            raise ValueError(f"Shard {manifest.shard} belongs to a different job "
+                             f"(seed, params, corpus version, total or shard count differ)")
+
+    ordered = sorted(manifests, key = lambda manifest: manifest.shard)
+    shards = [manifest.shard for manifest in ordered]
+    expected = list(range(ordered[0].shards))
+    if shards != expected:
+        missing = sorted(set(expected) - set(shards))
+        raise ValueError(f"Expected shards 0..{len(expected) - 1} once each; "
+                         f"missing {missing}, got {shards}")
+
+    plan = plan_shards(ordered[0].total, ordered[0].shards)
+    for manifest, positions in zip(ordered, plan):
+        if (manifest.start, manifest.stop) != (positions.start, positions.stop):
+            raise ValueError(f"Shard {manifest.shard} covers {manifest.start}..{manifest.stop}, "
+                             f"expected {positions.start}..{positions.stop}")
+    return ordered
+
+def merge(manifest_paths: Iterable[str], output: str,
+          compression: Optional[str] = None,
+          level: Optional[int] = None) -> List[ShardManifest]:
+    """Validate Shards and Stream Them into One Export
+
+    Shard files are copied in roster order a buffer at a time and checked
+    against their manifest's size and checksum on the way through. The
+    output only appears under its final name if every shard checks out.
+
+    Args:
+        manifest_paths: Manifest Files, or Directories Holding Them
+        output: Merged Export Path
+        compression: Output Codec (see lore_export.open_output)
+        level: Compression Level (codec default if None)
+
+    Returns:
+        The Merged Shards' Manifests, in Order
+    """
+    loaded = [(path, ShardManifest.load(path)) for path in find_manifests(manifest_paths)]
+    manifests = validate([manifest for _, manifest in loaded])
+    directories = {manifest.shard: os.path.dirname(path) for path, manifest in loaded}
+
+    partial = output + ".part"
+    try:
+        with open_output(partial, "wb", compression, level) as out:
+            out.write(HEADER.format(total = manifests[0].total).encode("utf-8"))
+            for manifest in manifests:
+                _copy_checked(os.path.join(directories[manifest.shard], manifest.path), manifest, out)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    os.replace(partial, output)
+    return manifests
+
+def _copy_checked(path: str, manifest: ShardManifest, out) -> None:
+    """Copy a Shard File While Checking Its Size and Checksum"""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(COPY_BUFFER)
+            if not chunk:
+                break
+            digest.update(chunk)
+            size += len(chunk)
+            out.write(chunk)
+    if size != manifest.size or digest.hexdigest() != manifest.sha256:
+        raise ValueError(f"{path} does not match its manifest (size or checksum differs)")
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest = "command", required = True)
+
+    run = commands.add_parser("run", help = "generate one shard")
+    run.add_argument("--seed", type = int, required = True)
+    run.add_argument("--total", type = int, required = True)
+    run.add_argument("--shards", type = int, required = True)
+    run.add_argument("--shard", type = int, required = True)
+    run.add_argument("--params", help = "parameters JSON file (defaults if omitted)")
+    run.add_argument("--corpus", default = DEFAULT_CORPUS)
+    run.add_argument("--out", default = ".", help = "output directory")
+
+    combine = commands.add_parser("merge", help = "validate shards and merge them into one export")
+    combine.add_argument("manifests", nargs = "+", help = "manifest files or directories holding them")
+    combine.add_argument("--out", default = "all_characters.md")
+    combine.add_argument("--compression", choices = ["gzip", "bz2", "xz", "zstd"])
+    combine.add_argument("--level", type = int, help = "compression level (codec default if omitted)")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        params = LoreParameters.from_json(args.params) if args.params else None
+        manifest = run_shard(args.seed, args.total, args.shards, args.shard, args.out, params, args.corpus)
+        print(f"Shard {manifest.shard} of {manifest.shards}: characters {manifest.start + 1}-{manifest.stop} "
+              f"written to {os.path.join(args.out, manifest.path)}")
+    else:
+        manifests = merge(args.manifests, args.out, args.compression, args.level)
+        print(f"Merged {len(manifests)} shards ({manifests[0].total} characters) into {args.out}")
+
+if __name__ == "__main__":
+    main()
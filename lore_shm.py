@@ -0,0 +1,166 @@
+"""
+Shared-Memory Handoff from Generator Workers to One Writer
+"""
+
+import multiprocessing
+import struct
+from multiprocessing import shared_memory
+from typing import Optional
+
+from lore_generator import LoreGenerator
+from lore_export import CharacterWriter
+
+# Records in the slot, and whether they finish the slot's current batch
+SLOT_HEADER = struct.Struct("<I?")
+# Roster position, then offset and length of the UTF-8 narrative in the payload
+ENTRY = struct.Struct("<QII")
+
+# Seconds between checks that the workers are still alive
+POLL_INTERVAL = 1.0
+
+def _produce(generator: LoreGenerator, seed: int, total: int, batch_size: int,
+             payload_size: int, worker: int, workers: int, slots: int, slot_size: int,
+             name: str, free, full) -> None:
+    """Worker Loop: Render Batches worker, worker + workers, ... into Their Slots
+
+    A batch whose narratives overflow the payload is handed over in
+    several fills of the same slot.
+    """
+    shm = shared_memory.SharedMemory(name = name)
+    try:
+        buffer = shm.buf
+        entries_size = batch_size * ENTRY.size
+        batches = (total + batch_size - 1) // batch_size
+        for batch in range(worker, batches, workers):
+            slot = batch % slots
+            base = slot * slot_size
+            index = batch * batch_size
+            stop = min(index + batch_size, total)
+            pending = None
+            while index < stop:
+                free[slot].acquire()
+                entry = base + SLOT_HEADER.size
+                payload = entry + entries_size
+                used = 0
+                count = 0
+                while index < stop:
+                    if pending is None:
+                        pending = generator.generate_at(seed, index).to_narrative().encode("utf-8")
+                    length = len(pending)
+                    if used + length > payload_size:
+                        if count == 0:
+                            raise ValueError(f"Character {index} needs {length} bytes, "
+                                             f"more than a slot's {payload_size} byte payload")
+                        break
+                    buffer[payload + used:payload + used + length] = pending
+                    ENTRY.pack_into(buffer, entry, index, used, length)
+                    entry += ENTRY.size
+                    used += length
+                    count += 1
+                    index += 1
+                    pending = None
+                SLOT_HEADER.pack_into(buffer, base, count, index == stop)
+                full[slot].release()
+        del buffer
+    finally:
+        shm.close()
+
+class SharedRing:
+    """Ring of Shared-Memory Slots Carrying Rendered Characters to the Writer
+
+    Workers generate contiguous batches of a seeded roster and write each
+    narrative as UTF-8 straight into a shared memory slot, with a packed
+    array of (position, offset, length) entries in front of it. The
+    parent adds the export's headings and separators and flushes each
+    narrative from a memoryview over the slot, so no CharacterLore or
+    string is pickled or copied into the parent on the way.
+
+    Batch b always goes through slot b % slots and slots is a multiple of
+    the worker count, so every slot belongs to one worker, and the writer
+    takes batches strictly in order for output identical to a
+    sequential run.
+    """
+
+    def __init__(self, generator: Optional[LoreGenerator] = None,
+                 processes: Optional[int] = None,
+                 batch_size: int = 256, depth: int = 2,
+                 payload_size: int = 1024 * 1024):
+        """Set Up a Transport
+
+        Args:
+            generator: Generator to Run in the Workers (a new one if None)
+            processes: Worker Processes (CPU count if None)
+            batch_size: Characters per Batch
+            depth: Slots per Worker; more lets workers run further ahead of the writer
+            payload_size: Narrative Bytes per Slot
+        """
+        if batch_size < 1 or depth < 1:
+            raise ValueError("batch_size and depth must be at least 1")
+        self.generator = generator or LoreGenerator()
+        self.processes = processes or multiprocessing.cpu_count()
+        self.batch_size = batch_size
+        self.payload_size = payload_size
+        self.slots = self.processes * depth
+        self.slot_size = SLOT_HEADER.size + batch_size * ENTRY.size + payload_size
+
+    def write(self, path: str, total: int, seed: int,
+              compression: Optional[str] = None,
+              level: Optional[int] = None) -> int:
+        """Generate Positions 0..total of a Seeded Roster into an Export
+
+        Returns:
+            Number of Characters Written
+        """
+        context = multiprocessing.get_context()
+        free = [context.Semaphore(1) for _ in range(self.slots)]
+        full = [context.Semaphore(0) for _ in range(self.slots)]
+        shm = shared_memory.SharedMemory(create = True, size = self.slots * self.slot_size)
+        workers = [
+            context.Process(target = _produce, daemon = True, args = (
+                self.generator, seed, total, self.batch_size, self.payload_size,
+                worker, self.processes, self.slots, self.slot_size, shm.name, free, full))
+            for worker in range(self.processes)
+        ]
+        try:
+            for worker in workers:
+                worker.start()
+            with CharacterWriter(path, total, compression, level) as writer:
+                self._drain(shm.buf, writer, total, workers, free, full)
+            for worker in workers:
+                worker.join()
+            return total
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+            shm.close()
+            shm.unlink()
+
+    def _drain(self, buffer, writer: CharacterWriter, total: int, workers, free, full) -> None:
+        """Writer Loop: Flush Batches in Order Straight Out of Their Slots"""
+        entries_size = self.batch_size * ENTRY.size
+        batches = (total + self.batch_size - 1) // self.batch_size
+        for batch in range(batches):
+            slot = batch % self.slots
+            base = slot * self.slot_size
+            payload = base + SLOT_HEADER.size + entries_size
+            last = False
+            while not last:
+                while not full[slot].acquire(timeout = POLL_INTERVAL):
+                    failed = [worker for worker in workers if worker.exitcode not in (None, 0)]
+                    if failed:
+                        raise RuntimeError(f"Generator worker exited with code {failed[0].exitcode}")
+
+                count, last = SLOT_HEADER.unpack_from(buffer, base)
+                for entry in ENTRY.iter_unpack(buffer[base + SLOT_HEADER.size:
+                                                      base + SLOT_HEADER.size + count * ENTRY.size]):
+                    _, offset, length = entry
+                    writer.write_encoded(buffer[payload + offset:payload + offset + length])
+                free[slot].release()
+
+def write_shared(path: str, total: int, seed: int,
+                 generator: Optional[LoreGenerator] = None,
+                 processes: Optional[int] = None,
+                 compression: Optional[str] = None) -> int:
+    """Generate a Seeded Roster in Parallel into One Export Through a SharedRing"""
+    return SharedRing(generator, processes).write(path, total, seed, compression)
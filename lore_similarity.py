@@ -0,0 +1,166 @@
+"""
+Near-Duplicate Detection Across Generated Characters
+"""
+
+import hashlib
+import random
+from functools import reduce
+from operator import or_
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from lore_generator import CharacterLore
+
+# Mersenne prime used for the MinHash permutations
+_PRIME = (1 << 61) - 1
+
+def character_features(lore: CharacterLore) -> List[str]:
+    """The Personality Choices Two Characters Are Compared On
+
+    Players notice shared traits, flaws, fears and conflicts; backstory
+    choices are left out so they do not dilute the overlap.
+    """
+    features = [f"trait:{trait}" for trait in lore.personality_traits]
+    features += [
+        f"flaw:{lore.fatal_flaw}",
+        f"fear:{lore.greatest_fear}",
+        f"conflict:{lore.internal_conflict}",
+    ]
+    return features
+
+class SimilarityIndex:
+    """MinHash LSH Index for Finding Characters Within a Jaccard Distance
+
+    Each character's choices become a bitset over a shared vocabulary and a
+    MinHash signature. Signatures are split into bands; characters sharing
+    any band bucket are candidates, and candidates are checked with exact
+    Jaccard distance on their bitsets. No query compares against every
+    stored character.
+
+    The corpus is finite, so every feature's hash values are computed once
+    and a signature is the elementwise minimum over a character's features.
+
+    With the defaults (32 bands of 4 rows), a pair at distance 0.3 is found
+    with probability above 0.999, at 0.45 (three of four traits, flaw and
+    fear shared) about 0.95, and at 0.6 only about half the time; see
+    recall(). Queries are reliable up to a max_distance of about 0.45.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, seed: int = 0):
+        """Create an Empty Index
+
+        Args:
+            num_perm: MinHash Signature Length
+            bands: LSH Bands; more bands find pairs at larger distances but check more candidates
+            seed: Seed for the MinHash Permutations
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        rng = random.Random(seed)
+        self._permutations = [(rng.randrange(1, _PRIME), rng.randrange(_PRIME)) for _ in range(num_perm)]
+        self._features: Dict[str, Tuple[int, Tuple[int, ...]]] = {}
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self.keys: List[Hashable] = []
+        self._bitsets: List[int] = []
+
+    @property
+    def threshold_distance(self) -> float:
+        """Jaccard Distance at Which a Pair Is Found About Half the Time"""
+        return 1 - (1 / self.bands) ** (1 / self.rows)
+
+    def recall(self, distance: float) -> float:
+        """Chance That a Pair at a Given Jaccard Distance Shares a Band"""
+        return 1 - (1 - (1 - distance) ** self.rows) ** self.bands
+
+    def _feature(self, feature: str) -> Tuple[int, Tuple[int, ...]]:
+        """Bit and MinHash Values of a Feature Seen for the First Time"""
+        value = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size = 8).digest(), "little")
+        entry = (1 << len(self._features), tuple((a * value + b) % _PRIME for a, b in self._permutations))
+        self._features[feature] = entry
+        return entry
+
+    def encode(self, lore: CharacterLore) -> Tuple[int, Tuple[int, ...]]:
+        """Bitset and MinHash Signature of a Character"""
+        known = self._features.get
+        entries = [known(feature) or self._feature(feature) for feature in character_features(lore)]
+        bits, vectors = zip(*entries)
+        bitset = reduce(or_, bits)
+        if len(vectors) == 1:
+            return bitset, vectors[0]
+        return bitset, tuple(map(min, *vectors))
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[int]:
+        rows = self.rows
+        return [hash(signature[i:i + rows]) for i in range(0, self.num_perm, rows)]
+
+    def add(self, lore: CharacterLore, key: Optional[Hashable] = None) -> Hashable:
+        """Index a Character Under a Key (Its Position if None)"""
+        bitset, signature = self.encode(lore)
+        return self._add(bitset, self._band_keys(signature), key)
+
+    def _add(self, bitset: int, bands: List[int], key: Optional[Hashable]) -> Hashable:
+        position = len(self.keys)
+        key = position if key is None else key
+        self.keys.append(key)
+        self._bitsets.append(bitset)
+        for buckets, band in zip(self._buckets, bands):
+            buckets.setdefault(band, []).append(position)
+        return key
+
+    def _candidates(self, bands: List[int]) -> set:
+        candidates = set()
+        for buckets, band in zip(self._buckets, bands):
+            positions = buckets.get(band)
+            if positions:
+                candidates.update(positions)
+        return candidates
+
+    def _matches(self, bitset: int, bands: List[int],
+                 max_distance: float) -> List[Tuple[int, float]]:
+        matches = []
+        for position in self._candidates(bands):
+            other = self._bitsets[position]
+            distance = 1 - (bitset & other).bit_count() / (bitset | other).bit_count()
+            if distance <= max_distance:
+                matches.append((position, distance))
+        return matches
+
+    def query(self, lore: CharacterLore, max_distance: float) -> List[Tuple[Hashable, float]]:
+        """Indexed Characters Within a Jaccard Distance, Closest First
+
+        Pairs near max_distance are found with probability recall(distance),
+        so max_distance should stay within the reliable range.
+        """
+        bitset, signature = self.encode(lore)
+        matches = self._matches(bitset, self._band_keys(signature), max_distance)
+        matches.sort(key = lambda match: (match[1], match[0]))
+        return [(self.keys[position], distance) for position, distance in matches]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+def dedup(lores: Iterable[CharacterLore], max_distance: float,
+          index: Optional[SimilarityIndex] = None) -> List[int]:
+    """Positions of Characters to Keep, Dropping Near-Duplicates of Earlier Ones
+
+    Args:
+        lores: Characters in Priority Order
+        max_distance: Jaccard Distance at or Below Which a Later Character Is Dropped
+        index: Index to Deduplicate Into (a new one if None)
+
+    Returns:
+        Positions of the Kept Characters
+    """
+    if index is None:
+        index = SimilarityIndex()
+    kept = []
+    for position, lore in enumerate(lores):
+        bitset, signature = index.encode(lore)
+        bands = index._band_keys(signature)
+        if not index._matches(bitset, bands, max_distance):
+            index._add(bitset, bands, position)
+            kept.append(position)
+    return kept
@@ -0,0 +1,163 @@
+"""
+Parallel Parameter Sweeps Over LoreParameters
+"""
+
+import itertools
+import multiprocessing
+from collections import Counter
+from dataclasses import dataclass, field, fields
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lore_generator import LoreGenerator, LoreParameters
+
+PRESETS = {
+    "tragic_hero": LoreParameters.tragic_hero,
+    "mysterious_stranger": LoreParameters.mysterious_stranger,
+    "epic_villain": LoreParameters.epic_villain,
+}
+
+# Samples handed to a worker at a time
+CHUNK_SIZE = 250
+
+@dataclass
+class CellSummary:
+    """Summary Statistics for One Sweep Configuration"""
+    label: str
+    params: LoreParameters
+    samples: int = 0
+    mean_age: float = 0.0
+    mean_traits: float = 0.0
+    mean_moments: float = 0.0
+    tragedy_share: float = 0.0
+    mean_relationships: float = 0.0
+    hidden_truth_rate: float = 0.0
+    archetypes: Dict[str, int] = field(default_factory = dict)
+
+def parameter_grid(**values: Iterable) -> Dict[str, LoreParameters]:
+    """Build Every Combination of the Given Parameter Values
+
+    Args:
+        values: LoreParameters field name -> values to try (defaults for omitted fields)
+
+    Returns:
+        Label -> Parameters, e.g. "tragedy_weight=0.2,mystery_factor=0.5"
+    """
+    names = [f.name for f in fields(LoreParameters)]
+    for name in values:
+        if name not in names:
+            raise ValueError(f"Unknown parameter: {name}")
+
+    keys = list(values)
+    grid = {}
+    for combo in itertools.product(*(values[key] for key in keys)):
+        settings = dict(zip(keys, combo))
+        label = ",".join(f"{key}={value}" for key, value in settings.items())
+        grid[label] = LoreParameters(**settings)
+    return grid
+
+def presets() -> Dict[str, LoreParameters]:
+    """The Built-In Presets Keyed by Name"""
+    return {name: preset() for name, preset in PRESETS.items()}
+
+# Loaded once per process and shared by every task the process runs
+_generator: Optional[LoreGenerator] = None
+
+def _init_worker(generator: LoreGenerator) -> None:
+    global _generator
+    _generator = generator
+
+def _run_chunk(task: Tuple[str, LoreParameters, int, int, int]) -> Tuple[str, list, Counter]:
+    """Generate One Chunk of Samples and Return Partial Sums"""
+    label, params, seed, start, stop = task
+    generator = _generator.with_params(params)
+    tragedy = set(generator.corpus.tragedy_moments)
+
+    # samples, age, traits, moments, tragic moments, relationships, hidden truths
+    totals = [0, 0, 0, 0, 0, 0, 0]
+    archetypes = Counter()
+    for index in range(start, stop):
+        lore = generator.generate_at(seed, index)
+        totals[0] += 1
+        totals[1] += lore.age
+        totals[2] += len(lore.personality_traits)
+        totals[3] += len(lore.defining_moments)
+        totals[4] += sum(1 for moment in lore.defining_moments if moment in tragedy)
+        totals[5] += len(lore.key_relationships)
+        totals[6] += lore.hidden_truth is not None
+        archetypes[lore.archetype.value] += 1
+    return label, totals, archetypes
+
+def sweep(configs: Dict[str, LoreParameters], samples: int, seed: int = 0,
+          processes: Optional[int] = None,
+          generator: Optional[LoreGenerator] = None) -> List[CellSummary]:
+    """Generate Samples for Every Configuration Across a Process Pool
+
+    Every configuration draws from the same seeded roster positions, so
+    differences between cells come from the parameters, not the seeds.
+
+    Args:
+        configs: Label -> Parameters (see parameter_grid and presets)
+        samples: Characters to Generate per Configuration
+        seed: Roster Seed
+        processes: Worker Processes (CPU count if None, 0 to run in this process)
+        generator: Generator Whose Corpus Is Shared With the Workers
+
+    Returns:
+        One Summary per Configuration, in Input Order
+    """
+    generator = generator or LoreGenerator()
+    tasks = [
+        (label, params, seed, start, min(start + CHUNK_SIZE, samples))
+        for label, params in configs.items()
+        for start in range(0, samples, CHUNK_SIZE)
+    ]
+
+    if processes == 0:
+        _init_worker(generator)
+        results = map(_run_chunk, tasks)
+        return _summarize(configs, results)
+
+    with multiprocessing.Pool(processes, initializer = _init_worker, initargs = (generator,)) as pool:
+        return _summarize(configs, pool.imap_unordered(_run_chunk, tasks))
+
+def _summarize(configs: Dict[str, LoreParameters], results) -> List[CellSummary]:
+    """Merge Partial Sums into Per-Configuration Summaries"""
+    totals = {label: [0] * 7 for label in configs}
+    archetypes = {label: Counter() for label in configs}
+    for label, partial, counts in results:
+        totals[label] = [a + b for a, b in zip(totals[label], partial)]
+        archetypes[label].update(counts)
+
+    summaries = []
+    for label, params in configs.items():
+        count, age, traits, moments, tragic, relationships, hidden = totals[label]
+        summaries.append(CellSummary(
+            label = label,
+            params = params,
+            samples = count,
+            mean_age = age / count if count else 0.0,
+            mean_traits = traits / count if count else 0.0,
+            mean_moments = moments / count if count else 0.0,
+            tragedy_share = tragic / moments if moments else 0.0,
+            mean_relationships = relationships / count if count else 0.0,
+            hidden_truth_rate = hidden / count if count else 0.0,
+            archetypes = dict(archetypes[label])
+        ))
+    return summaries
+
+def main():
+    """Sweep the Presets and a Small Grid, Printing One Row per Cell"""
+    configs = presets()
+    configs.update(parameter_grid(
+        tragedy_weight = [0.2, 0.5, 0.8],
+        mystery_factor = [0.1, 0.5, 0.9]
+    ))
+    summaries = sweep(configs, samples = 2000)
+
+    print(f"{'Configuration':<45} {'Moments':>8} {'Tragic':>7} {'Rels':>5} {'Hidden':>7}")
+    for s in summaries:
+        print(f"{s.label:<45} {s.mean_moments:>8.2f} {s.tragedy_share:>7.2f} "
+              f"{s.mean_relationships:>5.2f} {s.hidden_truth_rate:>7.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Compiled Narrative Templates
+"""
+
+from string import Formatter
+from typing import Dict, Optional
+
+from lore_generator import LoreGenerator, CharacterLore
+
+# Reproduces CharacterLore.to_narrative()
+NARRATIVE_LAYOUT = (
+    "# {name}\n\n"
+    "## Identity\n"
+    "Age: {age}\n"
+    "Archetype: {archetype}\n"
+    "Personality: {personality}\n"
+    "Distinctive Features: {distinctive_features}\n\n"
+    "## Background\n"
+    "Origin: {origin}\n"
+    "Birthplace: {birthplace}\n\n"
+    "## Defining Moments\n"
+    "{defining_moments}\n"
+    "## Psychology\n"
+    "Core Motivation: {core_motivation}\n"
+    "Fatal Flaw: {fatal_flaw}\n"
+    "Greatest Fear: {greatest_fear}\n"
+    "Internal Conflict: {internal_conflict}"
+    "{hidden_truth_line}"
+    "{relationships_section}"
+)
+
+# Fields a corpus string may refer to, as expressions over lore
+CORPUS_FIELDS = {
+    "name": "lore.name",
+    "age": "str(lore.age)",
+    "archetype": "lore.archetype._value_",
+    "origin": "lore.origin._value_",
+    "birthplace": "lore.birthplace",
+}
+
+def _parse(text: str) -> list:
+    """Split a Template into Literal Strings and Field Names"""
+    segments = []
+    for literal, field, spec, conversion in Formatter().parse(text):
+        if literal:
+            segments.append(literal)
+        if field is None:
+            continue
+        if spec or conversion:
+            raise ValueError(f"Format specs are not supported: {{{field}}}")
+        segments.append((field,))
+    return segments
+
+class CompiledTemplate:
+    """A Template Compiled Once into a Single Join Over Its Segments
+
+    The template is parsed at compile time into literal strings and field
+    expressions, which become the body of one generated render function.
+    Rendering does no parsing at all.
+    """
+
+    def __init__(self, text: str, fields: Dict[str, str], helpers: Optional[dict] = None):
+        self.text = text
+        parts = []
+        for segment in _parse(text):
+            if isinstance(segment, str):
+                parts.append(repr(segment))
+            elif segment[0] in fields:
+                parts.append(fields[segment[0]])
+            else:
+                raise ValueError(f"Unknown template field: {{{segment[0]}}}")
+
+        source = f"def render(lore):\n    return ''.join(({', '.join(parts)},))\n"
+        namespace = dict(helpers or {})
+        exec(compile(source, f"<template {text[:40]!r}>", "exec"), namespace)
+        self.render = namespace["render"]
+        self.render.__doc__ = "Render One Character"
+
+class TemplateEngine:
+    """Compiles Layout Templates and Placeholders Inside Corpus Strings
+
+    Corpus strings such as "Who betrayed {name} at {birthplace}" are
+    compiled once when the engine is built, and substituted whenever a
+    character using them is rendered. Fields that can never hold a
+    placeholder are read straight off the character.
+    """
+
+    def __init__(self, generator: Optional[LoreGenerator] = None):
+        self._corpus = {}
+        if generator is not None:
+            # A birthplace can hold placeholders of its own
+            corpus_fields = dict(CORPUS_FIELDS, birthplace = "resolve(lore.birthplace, lore)")
+            for _, text in generator.corpus.rendered_strings():
+                if "{" in text and text not in self._corpus:
+                    self._corpus[text] = CompiledTemplate(text, corpus_fields, {"resolve": self._resolve}).render
+
+        def field(expression: str) -> str:
+            return f"resolve({expression}, lore)" if self._corpus else expression
+
+        self.fields = dict(CORPUS_FIELDS)
+        self.fields.update({
+            "personality": "', '.join(lore.personality_traits)",
+            "distinctive_features": field("lore.distinctive_features"),
+            "birthplace": field("lore.birthplace"),
+            "core_motivation": field("lore.core_motivation"),
+            "fatal_flaw": field("lore.fatal_flaw"),
+            "greatest_fear": field("lore.greatest_fear"),
+            "internal_conflict": field("lore.internal_conflict"),
+            "hidden_truth": "hidden_truth(lore)",
+            "hidden_truth_line": "hidden_truth_line(lore)",
+            "defining_moments": "defining_moments(lore)",
+            "relationships": "relationships(lore)",
+            "relationships_section": "relationships_section(lore)",
+        })
+        if self._corpus:
+            self.helpers = {
+                "resolve": self._resolve,
+                "hidden_truth": self._hidden_truth,
+                "hidden_truth_line": self._hidden_truth_line,
+                "defining_moments": self._defining_moments,
+                "relationships": self._relationships,
+                "relationships_section": self._relationships_section,
+            }
+        else:
+            self.helpers = {
+                "hidden_truth": _hidden_truth,
+                "hidden_truth_line": _hidden_truth_line,
+                "defining_moments": _defining_moments,
+                "relationships": _relationships,
+                "relationships_section": _relationships_section,
+            }
+        self.narrative = self.compile(NARRATIVE_LAYOUT)
+
+    def _resolve(self, text: str, lore: CharacterLore) -> str:
+        """Substitute Placeholders in a Corpus String"""
+        render = self._corpus.get(text)
+        if render is None:
+            return text
+        return render(lore)
+
+    def _hidden_truth(self, lore: CharacterLore) -> str:
+        if not lore.hidden_truth:
+            return ""
+        return self._resolve(lore.hidden_truth, lore)
+
+    def _hidden_truth_line(self, lore: CharacterLore) -> str:
+        if not lore.hidden_truth:
+            return ""
+        return "\nHidden Truth: " + self._resolve(lore.hidden_truth, lore)
+
+    def _defining_moments(self, lore: CharacterLore) -> str:
+        resolve = self._resolve
+        return "".join([
+            f"{i}. {resolve(moment, lore)}\n"
+            for i, moment in enumerate(lore.defining_moments, 1)
+        ])
+
+    def _relationships(self, lore: CharacterLore) -> str:
+        resolve = self._resolve
+        return "".join([
+            f"- **{rel['name']}** ({rel['role']}): {resolve(rel['description'], lore)}\n"
+            for rel in lore.key_relationships
+        ])
+
+    def _relationships_section(self, lore: CharacterLore) -> str:
+        if not lore.key_relationships:
+            return ""
+        return "\n\n## Relationships\n" + self._relationships(lore)
+
+    def compile(self, text: str) -> CompiledTemplate:
+        """Compile a Layout Template Against This Engine's Fields"""
+        return CompiledTemplate(text, self.fields, self.helpers)
+
+    def render(self, lore: CharacterLore) -> str:
+        """Render a Character with the Default Narrative Layout"""
+        return self.narrative.render(lore)
+# Helpers for corpora without placeholders
+
+def _hidden_truth(lore: CharacterLore) -> str:
+    return lore.hidden_truth or ""
+
+def _hidden_truth_line(lore: CharacterLore) -> str:
+    if not lore.hidden_truth:
+        return ""
+    return "\nHidden Truth: " + lore.hidden_truth
+
+def _defining_moments(lore: CharacterLore) -> str:
+    return "".join([f"{i}. {moment}\n" for i, moment in enumerate(lore.defining_moments, 1)])
+
+def _relationships(lore: CharacterLore) -> str:
+    return "".join([
+        f"- **{rel['name']}** ({rel['role']}): {rel['description']}\n"
+        for rel in lore.key_relationships
+    ])
+
+def _relationships_section(lore: CharacterLore) -> str:
+    if not lore.key_relationships:
+        return ""
+    return "\n\n## Relationships\n" + _relationships(lore)
+
+def compile_template(text: str) -> CompiledTemplate:
+    """Compile a Layout Template Without Corpus Placeholders"""
+    return TemplateEngine().compile(text)